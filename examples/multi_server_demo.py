@@ -9,189 +9,188 @@ to manage multiple servers and intelligently route tool requests.
 import json
 import os
 import sys
+from collections import defaultdict
 from simple_mcp_client import MultiMCPClient, SecurityManager
+from simple_mcp_client.core import ToolNotFoundError
+from simple_mcp_client.config import add_server_configs, list_server_configs
 
+# Example server URLs (replace with real ones)
+DEMO_SERVERS = [
+    "http://localhost:8001",  # Math tools server
+    "http://localhost:8002",  # File operations server
+    "http://localhost:8003",  # Database tools server
+]
 
-def demo_server_management():
+# Separator banners, built once
+_SEP50 = "=" * 50
+_SEP60 = "=" * 60
+
+# Pre-bound formatter for the "tool on server" lines printed in loops
+_TOOL_LINE = "{indent}- {name} on {server_url}".format
+
+
+def demo_server_management(client):
     """Demonstrate server management functionality."""
     print("🖥️  Server Management Demo")
-    print("=" * 50)
-    
-    # Create multi-server client
-    with MultiMCPClient() as client:
-        # Add multiple servers (example URLs - replace with real ones)
-        servers = [
-            "http://localhost:8001",  # Math tools server
-            "http://localhost:8002",  # File operations server
-            "http://localhost:8003",  # Database tools server
-        ]
-        
-        print("Adding servers...")
-        for i, server_url in enumerate(servers):
-            if client.add_server(server_url):
-                print(f"✅ Added server {i+1}: {server_url}")
-            else:
-                print(f"❌ Failed to add server {i+1}: {server_url}")
-        
-        # Show server information
-        print(f"\n📊 Server Information:")
-        server_info = client.get_server_info()
-        for url, info in server_info.items():
-            print(f"  - {url}: {info['tool_count']} tools, connected: {info['connected']}")
-        
-        # Show all available tools
-        print(f"\n🔧 Available Tools:")
-        tools = client.list_tools()
-        for tool in tools:
-            print(f"  - {tool.name}: {tool.description}")
-            print(f"    Server: {tool.server_url}")
+    print(_SEP50)
+    
+    # Show server information
+    print(f"📊 Server Information:")
+    lines = []
+    for url, info in client.get_server_info().items():
+        tool_count, connected = info['tool_count'], info['connected']
+        lines.append(f"  - {url}: {tool_count} tools, connected: {connected}")
+    sys.stdout.write("".join(line + "\n" for line in lines))
+    
+    # Show all available tools
+    print(f"\n🔧 Available Tools:")
+    tools = client.list_tools()
+    sys.stdout.write("".join(
+        f"  - {tool.name}: {tool.description}\n    Server: {tool.server_url}\n"
+        for tool in tools
+    ))
 
 
-def demo_tool_routing():
+def demo_tool_routing(client):
     """Demonstrate intelligent tool routing."""
     print("\n🔄 Tool Routing Demo")
-    print("=" * 50)
+    print(_SEP50)
     
-    with MultiMCPClient() as client:
-        # Add servers (replace with real URLs)
-        client.add_server("http://localhost:8001")
-        client.add_server("http://localhost:8002")
-        
-        # Search for tools
-        print("Searching for calculator tools...")
-        calculator_tools = client.search_tools("calculator")
-        print(f"Found {len(calculator_tools)} calculator tools:")
-        for tool in calculator_tools:
-            print(f"  - {tool.name} on {tool.server_url}")
-        
-        # Call a specific tool (if available)
-        tool_name = "calculator"
-        if client.find_tool(tool_name):
-            print(f"\nCalling {tool_name}...")
-            try:
-                response = client.call_tool(tool_name, {
-                    "operation": "add",
-                    "numbers": [1, 2, 3]
-                })
-                print(f"✅ Tool response: {response.result}")
-            except Exception as e:
-                print(f"❌ Error calling tool: {e}")
-        else:
-            print(f"Tool '{tool_name}' not found")
-
-
-def demo_configuration_management():
+    # Search for tools
+    print("Searching for calculator tools...")
+    calculator_tools = client.search_tools("calculator")
+    print(f"Found {len(calculator_tools)} calculator tools:")
+    sys.stdout.write("".join(
+        _TOOL_LINE(indent="  ", name=tool.name, server_url=tool.server_url) + "\n"
+        for tool in calculator_tools
+    ))
+    
+    # Call a specific tool (if available); call_tool does the lookup itself
+    tool_name = "calculator"
+    try:
+        response = client.call_tool(tool_name, {
+            "operation": "add",
+            "numbers": [1, 2, 3]
+        })
+        print(f"\n✅ Tool response from {tool_name}: {response.result}")
+    except ToolNotFoundError:
+        print(f"Tool '{tool_name}' not found")
+    except Exception as e:
+        print(f"❌ Error calling tool: {e}")
+
+
+def demo_configuration_management(client):
     """Demonstrate configuration management."""
     print("\n⚙️  Configuration Management Demo")
-    print("=" * 50)
-    
-    from simple_mcp_client.config import (
-        add_server_config,
-        list_server_configs,
-        remove_server_config
-    )
+    print(_SEP50)
     
     # Add servers to configuration
     print("Adding servers to configuration...")
     
-    add_server_config(
-        name="math-server",
-        url="http://localhost:8001",
-        description="Server providing mathematical operations",
-        tags=["math", "calculations"],
-        priority=1
-    )
-    
-    add_server_config(
-        name="file-server",
-        url="http://localhost:8002",
-        description="Server providing file operations",
-        tags=["files", "io"],
-        priority=2
-    )
+    # Servers that are already configured are skipped, so re-running is cheap
+    add_server_configs([
+        {
+            "name": "math-server",
+            "url": "http://localhost:8001",
+            "description": "Server providing mathematical operations",
+            "tags": ["math", "calculations"],
+            "priority": 1
+        },
+        {
+            "name": "file-server",
+            "url": "http://localhost:8002",
+            "description": "Server providing file operations",
+            "tags": ["files", "io"],
+            "priority": 2
+        },
+    ])
     
     # List configured servers
     print("\nConfigured servers:")
     servers = list_server_configs()
-    for server in servers:
-        print(f"  - {server.name}: {server.url}")
-        print(f"    Description: {server.description}")
-        print(f"    Tags: {', '.join(server.tags)}")
-        print(f"    Priority: {server.priority}")
+    tag_strs = {server.name: ', '.join(server.tags) for server in servers}
+    sys.stdout.write("".join(
+        f"  - {server.name}: {server.url}\n"
+        f"    Description: {server.description}\n"
+        f"    Tags: {tag_strs[server.name]}\n"
+        f"    Priority: {server.priority}\n"
+        for server in servers
+    ))
 
 
-def demo_security_integration():
+def demo_security_integration(client):
     """Demonstrate security integration with multi-server client."""
     print("\n🔒 Security Integration Demo")
-    print("=" * 50)
+    print(_SEP50)
     
-    try:
-        # Create security manager
-        security_manager = SecurityManager()
-        
-        # Create multi-server client with security
-        with MultiMCPClient(security_manager=security_manager) as client:
-            # Add servers (replace with real URLs)
-            client.add_server("http://localhost:8001")
-            client.add_server("http://localhost:8002")
-            
-            # Show security statistics
-            stats = client.get_stats()
-            print(f"📊 Client Statistics: {stats}")
-            
-            # List tools (will be screened for security)
-            tools = client.list_tools()
-            print(f"Found {len(tools)} safe tools across all servers")
-            
-    except Exception as e:
-        print(f"❌ Security demo error: {e}")
+    if client.security_manager is None:
+        print("❌ Security screening is disabled for this client")
         print("   Make sure LAKERA_GUARD_API_KEY is set for security features")
+        return
+    
+    # Show security statistics
+    stats = client.get_stats()
+    print(f"📊 Client Statistics: {stats}")
+    
+    # List tools (screened for security when the servers were added)
+    tools = client.list_tools()
+    print(f"Found {len(tools)} safe tools across all servers")
 
 
-def demo_advanced_features():
+def demo_advanced_features(client):
     """Demonstrate advanced multi-server features."""
     print("\n🚀 Advanced Features Demo")
-    print("=" * 50)
+    print(_SEP50)
     
-    with MultiMCPClient() as client:
-        # Add servers
-        client.add_server("http://localhost:8001")
-        client.add_server("http://localhost:8002")
-        
-        # Tool discovery and management
-        print("Tool discovery across servers...")
-        tools = client.list_tools()
-        
-        # Group tools by server
-        tools_by_server = {}
-        for tool in tools:
-            if tool.server_url not in tools_by_server:
-                tools_by_server[tool.server_url] = []
-            tools_by_server[tool.server_url].append(tool)
-        
-        print("Tools by server:")
-        for server_url, server_tools in tools_by_server.items():
-            print(f"  {server_url}:")
-            for tool in server_tools:
-                print(f"    - {tool.name}: {tool.description}")
-        
-        # Search functionality
-        print("\nSearching for tools...")
-        search_terms = ["calc", "file", "db"]
-        for term in search_terms:
-            matches = client.search_tools(term)
-            print(f"  '{term}': {len(matches)} matches")
-            for tool in matches:
-                print(f"    - {tool.name} on {tool.server_url}")
+    # Tool discovery and management
+    print("Tool discovery across servers...")
+    tools = client.list_tools()
+    
+    # Group tools by server
+    tools_by_server = defaultdict(list)
+    for tool in tools:
+        tools_by_server[tool.server_url].append(tool)
+    
+    lines = ["Tools by server:"]
+    for server_url, server_tools in tools_by_server.items():
+        lines.append(f"  {server_url}:")
+        lines.extend(f"    - {tool.name}: {tool.description}" for tool in server_tools)
+    print("\n".join(lines))
+    
+    # Search functionality
+    print("\nSearching for tools...")
+    search_terms = ["calc", "file", "db"]
+    lines = []
+    for term in search_terms:
+        matches = client.search_tools(term)
+        lines.append(f"  '{term}': {len(matches)} matches")
+        lines.extend(
+            _TOOL_LINE(indent="    ", name=tool.name, server_url=tool.server_url)
+            for tool in matches
+        )
+    print("\n".join(lines))
+
+
+def create_demo_client():
+    """Create the client shared by all demos, with security when available."""
+    try:
+        security_manager = SecurityManager()
+    except ValueError as e:
+        print(f"⚠️  Security disabled: {e}")
+        security_manager = None
+    
+    return MultiMCPClient(
+        security_manager=security_manager,
+        enable_security=security_manager is not None
+    )
 
 
 def main():
     """Main demonstration function."""
     print("🚀 Multi-Server MCP Client Demo")
-    print("=" * 60)
+    print(_SEP60)
     
     # Check if we have any servers configured
-    from simple_mcp_client.config import list_server_configs
     servers = list_server_configs()
     
     if not servers:
@@ -203,12 +202,23 @@ def main():
         print("   3. Enable them for use")
         print()
     
-    # Run demonstrations
-    demo_server_management()
-    demo_tool_routing()
-    demo_configuration_management()
-    demo_security_integration()
-    demo_advanced_features()
+    # Connect to every server once and share the client across all demos
+    with create_demo_client() as client:
+        print("Adding servers...")
+        results = client.add_servers(DEMO_SERVERS)
+        for i, (server_url, added) in enumerate(zip(DEMO_SERVERS, results)):
+            if added:
+                print(f"✅ Added server {i+1}: {server_url}")
+            else:
+                print(f"❌ Failed to add server {i+1}: {server_url}")
+        print()
+        
+        # Run demonstrations
+        demo_server_management(client)
+        demo_tool_routing(client)
+        demo_configuration_management(client)
+        demo_security_integration(client)
+        demo_advanced_features(client)
     
     print("\n🎉 Multi-server demonstration completed!")
     print("\n💡 Key Benefits:")
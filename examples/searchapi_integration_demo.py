@@ -24,28 +24,80 @@ Prerequisites:
    export LAKERA_GUARD_API_KEY='your-lakera-key-here'  # Optional for security
 """
 
+import asyncio
 import os
+import sys
 import json
-from typing import Dict, Any
-from simple_mcp_client import MCPClient
-from simple_mcp_client.core.multi_client import MultiMCPClient
-from simple_mcp_client.config.server_config import add_server_config, list_server_configs
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import requests
+
+from simple_mcp_client import AsyncMCPClient, MCPClient
+from simple_mcp_client.utils.helpers import create_session
+from simple_mcp_client.utils.json_fast import dumps as json_dumps
+
+# Separator banner, built once
+_SEP60 = "=" * 60
+
+# Read the environment once at import time
+SEARCHAPI_API_KEY = os.getenv("SEARCHAPI_API_KEY")
+LAKERA_GUARD_API_KEY = os.getenv("LAKERA_GUARD_API_KEY")
 
 
 def print_separator(title: str):
     """Print a formatted separator with title."""
-    print(f"\n{'='*60}")
-    print(f" {title}")
-    print(f"{'='*60}")
+    sys.stdout.write(f"\n{_SEP60}\n {title}\n{_SEP60}\n")
 
 
-def print_tool_info(tool):
-    """Print formatted tool information."""
-    print(f"  📋 {tool.name}")
-    print(f"     Description: {tool.description}")
-    print(f"     Parameters: {json.dumps(tool.parameters, indent=6)}")
-    print(f"     Server: {tool.server_url}")
-    print()
+def format_parameters(parameters: Dict[str, Any]) -> str:
+    """Render a tool parameter schema as JSON."""
+    return json_dumps(parameters).decode()
+
+
+def format_tool_info(tool) -> str:
+    """Format tool information as a printable block."""
+    return (
+        f"  📋 {tool.name}\n"
+        f"     Description: {tool.description}\n"
+        f"     Parameters: {format_parameters(tool.parameters)}\n"
+        f"     Server: {tool.server_url}\n"
+        "\n"
+    )
+
+
+def print_content(result: Optional[Dict[str, Any]]):
+    """Print the content of a tool result, or a notice when there is none."""
+    print((result or {}).get('content') or "No results or error occurred")
+
+
+def create_pooled_session() -> requests.Session:
+    """Create a keep-alive session whose connection pool can serve parallel calls."""
+    return create_session({"Connection": "keep-alive"}, pool_maxsize=16, max_retries=0)
+
+
+def call_tools_batch(
+    client: MCPClient,
+    ops: List[Tuple[str, Dict[str, Any]]],
+    available_tools: Iterable[str] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Run several independent tool calls as one batch.
+
+    If the server advertises a ``batch_execute`` tool the operations are sent
+    in a single request; otherwise the calls are dispatched in parallel.
+    Returns one result dictionary per operation, in input order.
+    """
+    if "batch_execute" in available_tools:
+        response = client.call_tool("batch_execute", {
+            "operations": [{"tool": name, "args": args} for name, args in ops],
+            "maxConcurrent": len(ops)
+        })
+        return (response.result or {}).get("results", [])
+    
+    with ThreadPoolExecutor(max_workers=max(len(ops), 1)) as executor:
+        responses = list(executor.map(lambda op: client.call_tool(*op), ops))
+    return [response.result or {} for response in responses]
 
 
 def demo_single_server_usage():
@@ -53,122 +105,154 @@ def demo_single_server_usage():
     print_separator("Single Server Usage Demo")
     
     # Create a single server client
-    # Assuming searchapi-mcp-server is running on localhost:5173
-    client = MCPClient("http://localhost:5173")
+    # Assuming searchapi-mcp-server is running on localhost:5173.
+    # The pooled session keeps connections alive, so connect, list_tools and
+    # the searches below all reuse the same TCP connections.
+    with create_pooled_session() as session, \
+            MCPClient("http://localhost:5173", http_session=session) as client:
+        try:
+            print("🔗 Connecting to searchapi-mcp-server...")
+            connected = client.connect()
+            if connected:
+                print("✅ Connected successfully!")
+            else:
+                print("❌ Failed to connect")
+                return
+            
+            # List available tools
+            print("\n📋 Available tools:")
+            response = client.list_tools()
+            if response.result and 'tools' in response.result:
+                tools = response.result['tools']
+                sys.stdout.write("".join(
+                    f"  📋 {tool_data.get('name', 'Unknown')}\n"
+                    f"     Description: {tool_data.get('description', 'No description')}\n"
+                    f"     Parameters: {format_parameters(tool_data.get('parameters', {}))}\n"
+                    "\n"
+                    for tool_data in tools
+                ))
+            
+            # Run the three searches as a single batch
+            tool_names = [tool.get('name') for tool in (response.result or {}).get('tools', [])]
+            searches = [
+                ("🔍 Google search", "search_google", {
+                    "query": "Model Context Protocol MCP",
+                    "limit": 5
+                }),
+                ("🎥 YouTube search", "search_youtube", {
+                    "query": "Model Context Protocol tutorial",
+                    "maxResults": 3,
+                    "order": "relevance"
+                }),
+                ("🖼️ Google image search", "search_google_images", {
+                    "query": "Model Context Protocol logo",
+                    "limit": 3
+                }),
+            ]
+            
+            print("🔍 Performing Google, YouTube and image searches...")
+            results = call_tools_batch(
+                client,
+                [(tool_name, args) for _, tool_name, args in searches],
+                tool_names
+            )
+            
+            for (label, _, _), result in zip(searches, results):
+                print(f"\n✅ {label} results:")
+                print_content(result)
+            
+        except Exception as e:
+            print(f"❌ Error: {e}")
+
+
+async def demo_async_single_server_usage():
+    """Run the three searches concurrently with the asyncio client."""
+    print_separator("Async Single Server Usage Demo")
     
     try:
-        print("🔗 Connecting to searchapi-mcp-server...")
-        connected = client.connect()
-        if connected:
-            print("✅ Connected successfully!")
-        else:
-            print("❌ Failed to connect")
-            return
-        
-        # List available tools
-        print("\n📋 Available tools:")
-        response = client.list_tools()
-        if response.result and 'tools' in response.result:
-            tools = response.result['tools']
-            for tool_data in tools:
-                print(f"  📋 {tool_data.get('name', 'Unknown')}")
-                print(f"     Description: {tool_data.get('description', 'No description')}")
-                print(f"     Parameters: {json.dumps(tool_data.get('parameters', {}), indent=6)}")
-                print()
-        
-        # Example 1: Google Search
-        print("🔍 Performing Google search...")
-        search_args = {
-            "query": "Model Context Protocol MCP",
-            "limit": 5
-        }
-        
-        response = client.call_tool("search_google", search_args)
-        print("✅ Google search results:")
-        if response.result and 'content' in response.result:
-            print(response.result['content'])
-        else:
-            print("No results or error occurred")
-        
-        # Example 2: YouTube Search
-        print("\n🎥 Performing YouTube search...")
-        youtube_args = {
-            "query": "Model Context Protocol tutorial",
-            "maxResults": 3,
-            "order": "relevance"
-        }
-        
-        response = client.call_tool("search_youtube", youtube_args)
-        print("✅ YouTube search results:")
-        if response.result and 'content' in response.result:
-            print(response.result['content'])
-        else:
-            print("No results or error occurred")
-        
-        # Example 3: Google Image Search
-        print("\n🖼️ Performing Google image search...")
-        image_args = {
-            "query": "Model Context Protocol logo",
-            "limit": 3
-        }
-        
-        response = client.call_tool("search_google_images", image_args)
-        print("✅ Google image search results:")
-        if response.result and 'content' in response.result:
-            print(response.result['content'])
-        else:
-            print("No results or error occurred")
-        
+        async with AsyncMCPClient("http://localhost:5173") as client:
+            if not await client.connect():
+                print("❌ Failed to connect")
+                return
+            
+            print("🔍 Running Google, YouTube and image searches concurrently...")
+            results = await asyncio.gather(
+                client.call_tool("search_google", {
+                    "query": "Model Context Protocol MCP",
+                    "limit": 5
+                }),
+                client.call_tool("search_youtube", {
+                    "query": "Model Context Protocol tutorial",
+                    "maxResults": 3,
+                    "order": "relevance"
+                }),
+                client.call_tool("search_google_images", {
+                    "query": "Model Context Protocol logo",
+                    "limit": 3
+                }),
+            )
+            
+            for label, response in zip(("Google", "YouTube", "Google image"), results):
+                print(f"\n✅ {label} search results:")
+                print_content(response.result)
+    
+    except ImportError as e:
+        print(f"⚠️ Skipping async demo: {e}")
     except Exception as e:
         print(f"❌ Error: {e}")
-    finally:
-        client.close()
 
 
 def demo_multi_server_usage():
     """Demonstrate multi-server usage with searchapi-mcp-server and other servers."""
     print_separator("Multi-Server Usage Demo")
     
+    # Only this demo needs the multi-server and configuration modules
+    from simple_mcp_client.core.multi_client import MultiMCPClient
+    from simple_mcp_client.config.server_config import add_server_configs, list_server_configs
+    
     # Create multi-server client
     client = MultiMCPClient()
     
     try:
-        # Add searchapi-mcp-server to configuration
+        # Add searchapi-mcp-server and some hypothetical other servers to the
+        # configuration in one write; servers already configured are skipped
         print("⚙️ Adding searchapi-mcp-server to configuration...")
-        add_server_config(
-            name="searchapi",
-            url="http://localhost:5173",
-            description="Search API tools for Google, YouTube, and image search",
-            tags=["search", "api", "google", "youtube"],
-            priority=1
-        )
-        
-        # Add some hypothetical other servers for demonstration
-        add_server_config(
-            name="math-server",
-            url="http://localhost:8001",
-            description="Mathematical operations and calculations",
-            tags=["math", "calculations"],
-            priority=2
-        )
-        
-        add_server_config(
-            name="file-server", 
-            url="http://localhost:8002",
-            description="File operations and management",
-            tags=["files", "io"],
-            priority=3
-        )
+        add_server_configs([
+            {
+                "name": "searchapi",
+                "url": "http://localhost:5173",
+                "description": "Search API tools for Google, YouTube, and image search",
+                "tags": ["search", "api", "google", "youtube"],
+                "priority": 1
+            },
+            {
+                "name": "math-server",
+                "url": "http://localhost:8001",
+                "description": "Mathematical operations and calculations",
+                "tags": ["math", "calculations"],
+                "priority": 2
+            },
+            {
+                "name": "file-server",
+                "url": "http://localhost:8002",
+                "description": "File operations and management",
+                "tags": ["files", "io"],
+                "priority": 3
+            },
+        ])
         
         # List configured servers
         print("\n📋 Configured servers:")
         servers = list_server_configs()
-        for server in servers:
-            print(f"  🖥️ {server.name}: {server.url}")
-            print(f"     Description: {server.description}")
-            print(f"     Tags: {', '.join(server.tags)}")
-            print(f"     Priority: {server.priority}")
-            print()
+        tag_strs = {server.name: ', '.join(server.tags) for server in servers}
+        sys.stdout.write("".join(
+            f"  🖥️ {server.name}: {server.url}\n"
+            f"     Description: {server.description}\n"
+            f"     Tags: {tag_strs[server.name]}\n"
+            f"     Priority: {server.priority}\n"
+            "\n"
+            for server in servers
+        ))
         
         # Add servers to client (only searchapi will be available)
         print("🔗 Connecting to configured servers...")
@@ -180,15 +264,15 @@ def demo_multi_server_usage():
         # List all available tools across servers
         print("\n📋 All available tools:")
         tools = client.list_tools()
-        for tool in tools:
-            print_tool_info(tool)
+        sys.stdout.write("".join(format_tool_info(tool) for tool in tools))
         
         # Search for specific tools
         print("🔍 Searching for search-related tools...")
         search_tools = client.search_tools("search")
         print(f"Found {len(search_tools)} search-related tools:")
-        for tool in search_tools:
-            print(f"  - {tool.name} (on {tool.server_url})")
+        sys.stdout.write("".join(
+            f"  - {tool.name} (on {tool.server_url})\n" for tool in search_tools
+        ))
         
         # Call tools without knowing which server they're on
         print("\n🎯 Calling tools with automatic routing...")
@@ -199,10 +283,7 @@ def demo_multi_server_usage():
             "limit": 3
         })
         print("✅ Google search completed via automatic routing")
-        if response.result and 'content' in response.result:
-            print(response.result['content'])
-        else:
-            print("No results or error occurred")
+        print_content(response.result)
         
         # Get statistics
         stats = client.get_stats()
@@ -320,15 +401,12 @@ def main():
     print()
     
     # Check environment variables
-    searchapi_key = os.getenv("SEARCHAPI_API_KEY")
-    lakera_key = os.getenv("LAKERA_GUARD_API_KEY")
-    
     print("Environment Check:")
-    print(f"  SEARCHAPI_API_KEY: {'✅ Set' if searchapi_key else '❌ Not set'}")
-    print(f"  LAKERA_GUARD_API_KEY: {'✅ Set' if lakera_key else '⚠️ Not set (security disabled)'}")
+    print(f"  SEARCHAPI_API_KEY: {'✅ Set' if SEARCHAPI_API_KEY else '❌ Not set'}")
+    print(f"  LAKERA_GUARD_API_KEY: {'✅ Set' if LAKERA_GUARD_API_KEY else '⚠️ Not set (security disabled)'}")
     print()
     
-    if not searchapi_key:
+    if not SEARCHAPI_API_KEY:
         print("⚠️ Warning: SEARCHAPI_API_KEY not set. Some examples may fail.")
         print("   Get your API key from: https://searchapi.site/profile")
         print()
@@ -336,6 +414,7 @@ def main():
     # Run demos
     try:
         demo_single_server_usage()
+        asyncio.run(demo_async_single_server_usage())
         demo_multi_server_usage()
         demo_cli_equivalent()
         demo_configuration_file()
@@ -5,35 +5,47 @@ Setup script for SearchAPI MCP Server Demo
 This script helps you set up the environment needed to run the searchapi-mcp-server demo.
 """
 
+import functools
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 
-def run_command(command, description):
-    """Run a command and handle errors."""
+def run_command(args, description, cwd=None):
+    """Run a command, streaming its output, and handle errors."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
+        # Stream output line by line instead of buffering it all in memory
+        with subprocess.Popen(
+            args,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                print(f"   {line}", end="")
+        returncode = proc.returncode
+    except OSError as e:
         print(f"❌ {description} failed: {e}")
-        if e.stdout:
-            print(f"   stdout: {e.stdout}")
-        if e.stderr:
-            print(f"   stderr: {e.stderr}")
         return False
+    
+    if returncode != 0:
+        print(f"❌ {description} failed with exit code {returncode}")
+        return False
+    
+    print(f"✅ {description} completed successfully")
+    return True
 
 
+@functools.lru_cache(maxsize=None)
 def check_command(command):
-    """Check if a command is available."""
-    try:
-        subprocess.run([command, "--version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if a command is available on PATH."""
+    return shutil.which(command) is not None
 
 
 def setup_environment():
@@ -65,8 +77,9 @@ def setup_environment():
     if not searchapi_dir.exists():
         print("\n📥 Cloning searchapi-mcp-server...")
         if not run_command(
-            "cd .. && git clone https://github.com/mrgoonie/searchapi-mcp-server.git",
-            "Cloning searchapi-mcp-server repository"
+            ["git", "clone", "https://github.com/mrgoonie/searchapi-mcp-server.git"],
+            "Cloning searchapi-mcp-server repository",
+            cwd=".."
         ):
             return False
     else:
@@ -75,8 +88,9 @@ def setup_environment():
     # Install dependencies
     print("\n📦 Installing searchapi-mcp-server dependencies...")
     if not run_command(
-        "cd ../searchapi-mcp-server && npm install",
-        "Installing npm dependencies"
+        ["npm", "install"],
+        "Installing npm dependencies",
+        cwd="../searchapi-mcp-server"
     ):
         return False
     
@@ -97,15 +111,17 @@ def setup_environment():
     
     # Create .env file for searchapi-mcp-server
     env_file = Path("../searchapi-mcp-server/.env")
-    if not env_file.exists():
-        print("\n📝 Creating .env file for searchapi-mcp-server...")
-        env_content = f"""# SearchAPI MCP Server Environment Variables
+    env_content = f"""# SearchAPI MCP Server Environment Variables
 SEARCHAPI_API_KEY={searchapi_key or 'your-api-key-here'}
 DEBUG=true
 """
-        env_file.write_text(env_content)
+    try:
+        # Exclusive create: never overwrites an existing file, with no separate exists() check
+        with env_file.open("x", encoding="utf-8") as f:
+            print("\n📝 Creating .env file for searchapi-mcp-server...")
+            f.write(env_content)
         print("✅ Created .env file")
-    else:
+    except FileExistsError:
         print("✅ .env file already exists")
     
     print("\n🎉 Setup completed successfully!")
@@ -129,8 +145,8 @@ def start_server():
     
     try:
         subprocess.run(
-            "cd ../searchapi-mcp-server && npm run dev:server",
-            shell=True
+            ["npm", "run", "dev:server"],
+            cwd="../searchapi-mcp-server"
         )
     except KeyboardInterrupt:
         print("\n🛑 Server stopped")
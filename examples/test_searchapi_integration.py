@@ -4,124 +4,112 @@ Test script for SearchAPI MCP Server Integration
 
 This script tests the integration between our simple MCP client and the searchapi-mcp-server.
 It can be run to verify that everything is working correctly.
+
+Requires the package to be installed, e.g. with `pip install -e .`
 """
 
+import asyncio
 import os
 import sys
 import json
 from typing import Dict, Any
 
-# Add the src directory to the path so we can import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from simple_mcp_client import MCPClient
+from simple_mcp_client import AsyncMCPClient
 from simple_mcp_client.core.multi_client import MultiMCPClient
 from simple_mcp_client.config.server_config import add_server_config, list_server_configs
 
+# Summary labels indexed by the boolean test result
+_STATUS = ("❌ FAIL", "✅ PASS")
+
 
-def test_connection():
+async def test_connection(client):
     """Test basic connection to searchapi-mcp-server."""
-    print("🔗 Testing connection to searchapi-mcp-server...")
-    
-    client = MCPClient("http://localhost:5173")
+    out = ["🔗 Testing connection to searchapi-mcp-server..."]
     
     try:
-        connected = client.connect()
+        connected = await client.connect()
         if connected:
-            print("✅ Connection successful!")
+            out.append("✅ Connection successful!")
             return True
         else:
-            print("❌ Connection failed!")
+            out.append("❌ Connection failed!")
             return False
     except Exception as e:
-        print(f"❌ Connection error: {e}")
+        out.append(f"❌ Connection error: {e}")
         return False
     finally:
-        client.close()
+        sys.stdout.write("\n".join(out) + "\n")
 
 
-def test_tool_discovery():
+async def test_tool_discovery(client):
     """Test tool discovery from searchapi-mcp-server."""
-    print("\n📋 Testing tool discovery...")
-    
-    client = MCPClient("http://localhost:5173")
+    out = ["\n📋 Testing tool discovery..."]
     
     try:
-        client.connect()
-        response = client.list_tools()
+        response = await client.list_tools()
         
         if response.result and 'tools' in response.result:
             tools = response.result['tools']
-            print(f"✅ Found {len(tools)} tools:")
+            out.append(f"✅ Found {len(tools)} tools:")
             
             expected_tools = ['search_google', 'search_google_images', 'search_youtube']
             found_tools = [tool.get('name') for tool in tools]
             
             for expected in expected_tools:
                 if expected in found_tools:
-                    print(f"  ✅ {expected}")
+                    out.append(f"  ✅ {expected}")
                 else:
-                    print(f"  ❌ {expected} (not found)")
+                    out.append(f"  ❌ {expected} (not found)")
             
             return all(expected in found_tools for expected in expected_tools)
         else:
-            print("❌ No tools found or invalid response")
+            out.append("❌ No tools found or invalid response")
             return False
             
     except Exception as e:
-        print(f"❌ Tool discovery error: {e}")
+        out.append(f"❌ Tool discovery error: {e}")
         return False
     finally:
-        client.close()
+        sys.stdout.write("\n".join(out) + "\n")
 
 
-def test_tool_calls():
+async def test_tool_calls(client):
     """Test calling tools from searchapi-mcp-server."""
-    print("\n🔍 Testing tool calls...")
-    
-    client = MCPClient("http://localhost:5173")
+    out = ["\n🔍 Testing tool calls..."]
     
     try:
-        client.connect()
-        
-        # Test Google search
-        print("  Testing search_google...")
-        response = client.call_tool("search_google", {
-            "query": "Model Context Protocol",
-            "limit": 1
-        })
-        
-        if response.result and 'content' in response.result:
-            print("  ✅ search_google call successful")
-        else:
-            print("  ❌ search_google call failed")
-            return False
-        
-        # Test YouTube search
-        print("  Testing search_youtube...")
-        response = client.call_tool("search_youtube", {
-            "query": "MCP tutorial",
-            "maxResults": 1
-        })
+        # Test Google and YouTube search concurrently
+        out.append("  Testing search_google and search_youtube...")
+        responses = await asyncio.gather(
+            client.call_tool("search_google", {
+                "query": "Model Context Protocol",
+                "limit": 1
+            }),
+            client.call_tool("search_youtube", {
+                "query": "MCP tutorial",
+                "maxResults": 1
+            }),
+        )
         
-        if response.result and 'content' in response.result:
-            print("  ✅ search_youtube call successful")
-        else:
-            print("  ❌ search_youtube call failed")
-            return False
+        for tool_name, response in zip(("search_google", "search_youtube"), responses):
+            if response.result and 'content' in response.result:
+                out.append(f"  ✅ {tool_name} call successful")
+            else:
+                out.append(f"  ❌ {tool_name} call failed")
+                return False
         
         return True
         
     except Exception as e:
-        print(f"❌ Tool call error: {e}")
+        out.append(f"❌ Tool call error: {e}")
         return False
     finally:
-        client.close()
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_multi_server():
     """Test multi-server functionality."""
-    print("\n🖥️ Testing multi-server functionality...")
+    out = ["\n🖥️ Testing multi-server functionality..."]
     
     # Add server to configuration
     add_server_config(
@@ -139,16 +127,16 @@ def test_multi_server():
         # Add server
         success = client.add_server("http://localhost:5173")
         if not success:
-            print("❌ Failed to add server to multi-client")
+            out.append("❌ Failed to add server to multi-client")
             return False
         
         # List tools
         tools = client.list_tools()
-        print(f"✅ Found {len(tools)} tools in multi-server mode")
+        out.append(f"✅ Found {len(tools)} tools in multi-server mode")
         
         # Search for tools
         search_tools = client.search_tools("search")
-        print(f"✅ Found {len(search_tools)} search-related tools")
+        out.append(f"✅ Found {len(search_tools)} search-related tools")
         
         # Test tool routing
         response = client.call_tool("search_google", {
@@ -157,27 +145,28 @@ def test_multi_server():
         })
         
         if response.result and 'content' in response.result:
-            print("✅ Multi-server tool routing successful")
+            out.append("✅ Multi-server tool routing successful")
             return True
         else:
-            print("❌ Multi-server tool routing failed")
+            out.append("❌ Multi-server tool routing failed")
             return False
             
     except Exception as e:
-        print(f"❌ Multi-server error: {e}")
+        out.append(f"❌ Multi-server error: {e}")
         return False
     finally:
         client.close()
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_configuration():
     """Test configuration management."""
-    print("\n⚙️ Testing configuration management...")
+    out = ["\n⚙️ Testing configuration management..."]
     
     try:
         # List configured servers
         servers = list_server_configs()
-        print(f"✅ Found {len(servers)} configured servers")
+        out.append(f"✅ Found {len(servers)} configured servers")
         
         # Check for our test server
         test_server = None
@@ -187,18 +176,67 @@ def test_configuration():
                 break
         
         if test_server:
-            print(f"✅ Test server found: {test_server.name}")
-            print(f"  URL: {test_server.url}")
-            print(f"  Description: {test_server.description}")
-            print(f"  Tags: {', '.join(test_server.tags)}")
+            out.append(f"✅ Test server found: {test_server.name}")
+            out.append(f"  URL: {test_server.url}")
+            out.append(f"  Description: {test_server.description}")
+            out.append(f"  Tags: {', '.join(test_server.tags)}")
             return True
         else:
-            print("❌ Test server not found in configuration")
+            out.append("❌ Test server not found in configuration")
             return False
             
     except Exception as e:
-        print(f"❌ Configuration error: {e}")
+        out.append(f"❌ Configuration error: {e}")
         return False
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+async def run_configuration_tests():
+    """Run the multi-server and configuration tests, which share config state."""
+    # Configuration checks for the server added by the multi-server test, so
+    # these two run in order, off the event loop since they use blocking APIs
+    loop = asyncio.get_running_loop()
+    multi_server = await loop.run_in_executor(None, test_multi_server)
+    configuration = await loop.run_in_executor(None, test_configuration)
+    return [("Multi-Server", multi_server), ("Configuration", configuration)]
+
+
+async def run_tests():
+    """Run the independent tests concurrently and collect their results."""
+    test_names = ["Connection", "Tool Discovery", "Tool Calls"]
+    
+    try:
+        client = AsyncMCPClient("http://localhost:5173")
+    except (ImportError, ValueError) as e:
+        # Missing aiohttp extra or Lakera API key: the client tests cannot run
+        print(f"❌ Could not create the async client: {e}")
+        outcomes = await asyncio.gather(run_configuration_tests(), return_exceptions=True)
+        outcomes = [False] * len(test_names) + outcomes
+    else:
+        async with client:
+            outcomes = await asyncio.gather(
+                test_connection(client),
+                test_tool_discovery(client),
+                test_tool_calls(client),
+                run_configuration_tests(),
+                return_exceptions=True
+            )
+    
+    results = []
+    for test_name, outcome in zip(test_names, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {test_name} test crashed: {outcome}")
+            outcome = False
+        results.append((test_name, outcome))
+    
+    configuration_outcome = outcomes[-1]
+    if isinstance(configuration_outcome, Exception):
+        print(f"❌ Configuration tests crashed: {configuration_outcome}")
+        configuration_outcome = [("Multi-Server", False), ("Configuration", False)]
+    results.extend(configuration_outcome)
+    
+    return results
 
 
 def main():
@@ -212,23 +250,7 @@ def main():
         print("⚠️ SEARCHAPI_API_KEY not set. Some tests may fail.")
         print("   Set it with: export SEARCHAPI_API_KEY='your-api-key'")
     
-    # Run tests
-    tests = [
-        ("Connection", test_connection),
-        ("Tool Discovery", test_tool_discovery),
-        ("Tool Calls", test_tool_calls),
-        ("Multi-Server", test_multi_server),
-        ("Configuration", test_configuration),
-    ]
-    
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            results.append((test_name, False))
+    results = asyncio.run(run_tests())
     
     # Summary
     print("\n" + "=" * 50)
@@ -238,8 +260,7 @@ def main():
     total = len(results)
     
     for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"  {test_name}: {status}")
+        print(f"  {test_name}: {_STATUS[bool(result)]}")
         if result:
             passed += 1
     
@@ -9,7 +9,33 @@ __version__ = "0.1.0"
 __author__ = "Stephen Giguere"
 __email__ = "your.email@example.com"
 
-from .core.client import MCPClient
-from .security import SecurityManager, SecurityViolation, LakeraClient
+import importlib
 
-__all__ = ["MCPClient", "SecurityManager", "SecurityViolation", "LakeraClient"] 
\ No newline at end of file
+__all__ = ["AsyncMCPClient", "MCPClient", "MultiMCPClient", "SecurityManager", "SecurityViolation", "LakeraClient"]
+
+# Public names are imported on first access (PEP 562), so importing the
+# package itself does not pull in requests, pydantic or the security stack
+_LAZY_IMPORTS = {
+    "AsyncMCPClient": ".core.async_client",
+    "MCPClient": ".core.client",
+    "MultiMCPClient": ".core.multi_client",
+    "SecurityManager": ".security",
+    "SecurityViolation": ".security",
+    "LakeraClient": ".security",
+}
+
+
+def __getattr__(name):
+    """Import public names lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__)) 
\ No newline at end of file
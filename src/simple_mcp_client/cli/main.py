@@ -4,30 +4,121 @@ Command-line interface main module.
 This module provides the main CLI entry point for the Simple MCP Client.
 """
 
-import json
-import os
+import functools
+import re
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Optional, Tuple
 
 import click
 
-from ..core.client import MCPClient
-from ..core.multi_client import MultiMCPClient
-from ..config import add_server_config, list_server_configs, remove_server_config, load_config
-from ..security import SecurityManager, SecurityViolation
 from ..utils.helpers import validate_url
+from ..utils.json_fast import JSONDecodeError, dumps as json_dumps, loads as json_loads
+
+# The config, client and security modules pull in pydantic, requests and the
+# Lakera client, so they are imported inside the commands that need them.
+# Building the command tree, and so --help and --version, only needs click.
+if TYPE_CHECKING:
+    from ..security import SecurityManager
+
+# Separator for --tags, swallowing the whitespace around each comma
+_TAG_SPLIT = re.compile(r'\s*,\s*')
+
+# Messages shared by several commands
+_MSG_SECURITY_ENABLED = "🔒 Security screening enabled"
+_MSG_SECURITY_DISABLED = "⚠️  Security screening disabled"
+_MSG_INVALID_ARGUMENTS = "Error: Invalid JSON format for arguments"
+_INVALID_URL_PREFIX = "Error: Invalid URL format: "
+_SECURITY_VIOLATION_PREFIX = "🚨 Security violation: "
+
+
+def setup_security(disable_security: bool, lakera_api_key: Optional[str]) -> Tuple[Optional["SecurityManager"], bool]:
+    """
+    Set up security screening for a command.
+    
+    Args:
+        disable_security: Whether security screening was disabled
+        lakera_api_key: Lakera API key overriding the environment variable
+        
+    Returns:
+        Tuple of (security manager or None, whether security is enabled)
+    """
+    if disable_security:
+        click.echo(_MSG_SECURITY_DISABLED)
+        return None, False
+    
+    from ..security import get_security_manager
+    
+    try:
+        security_manager = get_security_manager(lakera_api_key)
+    except ValueError as e:
+        click.echo(f"⚠️  Security disabled: {e}", err=True)
+        return None, False
+    
+    click.echo(_MSG_SECURITY_ENABLED)
+    return security_manager, True
+
+
+def write_json(
+    output: BinaryIO,
+    data: Any,
+    description: str,
+    default: Optional[Callable[[Any], Any]] = None
+) -> None:
+    """
+    Write data as indented JSON to an output file opened by click.
+    
+    Args:
+        output: Binary file from a click.File option ('-' is stdout)
+        data: JSON-serialisable data to write
+        description: What was written, for the confirmation message
+        default: Function returning a serialisable version of other objects
+    """
+    output.write(json_dumps(data, indent=True, default=default) + b"\n")
+    if output.name != '-':
+        click.echo(f"{description} saved to {output.name}")
+
+
+def _tool_default(obj: Any) -> Dict[str, Any]:
+    """Serialise MCPTool objects while writing a tools list as JSON."""
+    from ..core.multi_client import MCPTool
+    
+    if isinstance(obj, MCPTool):
+        return {
+            "name": obj.name,
+            "description": obj.description,
+            "server": obj.server_url,
+            "parameters": obj.parameters
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def with_security(func: Callable[..., None]) -> Callable[..., None]:
+    """
+    Add the security options to a command and set up screening for it.
+    
+    The decorated command receives security_manager and enable_security
+    keyword arguments in place of the --disable-security and
+    --lakera-api-key options.
+    """
+    @click.option('--disable-security', is_flag=True, help='Disable security screening')
+    @click.option('--lakera-api-key', help='Lakera API key (overrides LAKERA_GUARD_API_KEY env var)')
+    @functools.wraps(func)
+    def wrapper(*args: Any, disable_security: bool, lakera_api_key: Optional[str], **kwargs: Any) -> None:
+        security_manager, enable_security = setup_security(disable_security, lakera_api_key)
+        return func(*args, security_manager=security_manager, enable_security=enable_security, **kwargs)
+    return wrapper
 
 
 @click.group()
 @click.version_option()
-def main():
+def main() -> None:
     """Simple MCP Client - A lightweight client for the Model Context Protocol."""
     pass
 
 
 # Single server commands
 @main.group()
-def server():
+def server() -> None:
     """Single server operations."""
     pass
 
@@ -35,29 +126,17 @@ def server():
 @server.command()
 @click.option('--server-url', '-u', required=True, help='MCP server URL')
 @click.option('--timeout', '-t', default=30, help='Request timeout in seconds')
-@click.option('--disable-security', is_flag=True, help='Disable security screening')
-@click.option('--lakera-api-key', help='Lakera API key (overrides LAKERA_GUARD_API_KEY env var)')
-def connect(server_url: str, timeout: int, disable_security: bool, lakera_api_key: Optional[str]):
+@with_security
+def connect(server_url: str, timeout: int, security_manager: Optional["SecurityManager"], enable_security: bool) -> None:
     """Test connection to an MCP server."""
+    from ..core.client import MCPClient
+    
     if not validate_url(server_url):
-        click.echo(f"Error: Invalid URL format: {server_url}", err=True)
+        click.echo(_INVALID_URL_PREFIX + server_url, err=True)
         sys.exit(1)
     
     try:
-        # Set up security if enabled
-        security_manager = None
-        if not disable_security:
-            if lakera_api_key:
-                os.environ['LAKERA_GUARD_API_KEY'] = lakera_api_key
-            try:
-                security_manager = SecurityManager()
-                click.echo("🔒 Security screening enabled")
-            except ValueError as e:
-                click.echo(f"⚠️  Security disabled: {e}", err=True)
-        else:
-            click.echo("⚠️  Security screening disabled")
-        
-        with MCPClient(server_url, timeout, security_manager, not disable_security) as client:
+        with MCPClient(server_url, timeout, security_manager, enable_security) as client:
             if client.connect():
                 click.echo(f"✅ Successfully connected to {server_url}")
                 
@@ -76,30 +155,19 @@ def connect(server_url: str, timeout: int, disable_security: bool, lakera_api_ke
 @server.command()
 @click.option('--server-url', '-u', required=True, help='MCP server URL')
 @click.option('--timeout', '-t', default=30, help='Request timeout in seconds')
-@click.option('--output', '-o', help='Output file (default: stdout)')
-@click.option('--disable-security', is_flag=True, help='Disable security screening')
-@click.option('--lakera-api-key', help='Lakera API key (overrides LAKERA_GUARD_API_KEY env var)')
-def list_tools(server_url: str, timeout: int, output: Optional[str], disable_security: bool, lakera_api_key: Optional[str]):
+@click.option('--output', '-o', type=click.File('wb', lazy=True), help='Save the tools list as JSON to this file')
+@with_security
+def list_tools(server_url: str, timeout: int, output: Optional[BinaryIO], security_manager: Optional["SecurityManager"], enable_security: bool) -> None:
     """List available tools from an MCP server."""
+    from ..core.client import MCPClient
+    from ..security import SecurityViolation
+    
     if not validate_url(server_url):
-        click.echo(f"Error: Invalid URL format: {server_url}", err=True)
+        click.echo(_INVALID_URL_PREFIX + server_url, err=True)
         sys.exit(1)
     
     try:
-        # Set up security if enabled
-        security_manager = None
-        if not disable_security:
-            if lakera_api_key:
-                os.environ['LAKERA_GUARD_API_KEY'] = lakera_api_key
-            try:
-                security_manager = SecurityManager()
-                click.echo("🔒 Security screening enabled")
-            except ValueError as e:
-                click.echo(f"⚠️  Security disabled: {e}", err=True)
-        else:
-            click.echo("⚠️  Security screening disabled")
-        
-        with MCPClient(server_url, timeout, security_manager, not disable_security) as client:
+        with MCPClient(server_url, timeout, security_manager, enable_security) as client:
             response = client.list_tools()
             
             if response.error:
@@ -110,16 +178,15 @@ def list_tools(server_url: str, timeout: int, output: Optional[str], disable_sec
             tools = result.get('tools', [])
             
             if output:
-                with open(output, 'w') as f:
-                    json.dump(tools, f, indent=2)
-                click.echo(f"Tools list saved to {output}")
+                write_json(output, tools, "Tools list")
             else:
                 if tools:
-                    click.echo(f"Found {len(tools)} tool(s):")
-                    for tool in tools:
-                        name = tool.get('name', 'Unknown')
-                        description = tool.get('description', 'No description')
-                        click.echo(f"  - {name}: {description}")
+                    lines = [f"Found {len(tools)} tool(s):"]
+                    lines.extend(
+                        f"  - {tool.get('name', 'Unknown')}: {tool.get('description', 'No description')}"
+                        for tool in tools
+                    )
+                    click.echo("\n".join(lines))
                 else:
                     click.echo("No tools available")
             
@@ -130,7 +197,7 @@ def list_tools(server_url: str, timeout: int, output: Optional[str], disable_sec
                           f"{stats['violations_detected']} violations detected")
                     
     except SecurityViolation as e:
-        click.echo(f"🚨 Security violation: {e}", err=True)
+        click.echo(f"{_SECURITY_VIOLATION_PREFIX}{e}", err=True)
         sys.exit(1)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -142,53 +209,35 @@ def list_tools(server_url: str, timeout: int, output: Optional[str], disable_sec
 @click.option('--tool-name', '-n', required=True, help='Name of the tool to call')
 @click.option('--arguments', '-a', help='Tool arguments as JSON string')
 @click.option('--timeout', '-t', default=30, help='Request timeout in seconds')
-@click.option('--output', '-o', help='Output file (default: stdout)')
-@click.option('--disable-security', is_flag=True, help='Disable security screening')
-@click.option('--lakera-api-key', help='Lakera API key (overrides LAKERA_GUARD_API_KEY env var)')
-def call_tool(server_url: str, tool_name: str, arguments: Optional[str], timeout: int, output: Optional[str], disable_security: bool, lakera_api_key: Optional[str]):
+@click.option('--output', '-o', type=click.File('wb', lazy=True), default='-', help='Output file (default: stdout)')
+@with_security
+def call_tool(server_url: str, tool_name: str, arguments: Optional[str], timeout: int, output: BinaryIO, security_manager: Optional["SecurityManager"], enable_security: bool) -> None:
     """Call a specific tool on an MCP server."""
+    from ..core.client import MCPClient
+    from ..security import SecurityViolation
+    
     if not validate_url(server_url):
-        click.echo(f"Error: Invalid URL format: {server_url}", err=True)
+        click.echo(_INVALID_URL_PREFIX + server_url, err=True)
         sys.exit(1)
     
     # Parse arguments
     tool_args = {}
     if arguments:
         try:
-            tool_args = json.loads(arguments)
-        except json.JSONDecodeError:
-            click.echo("Error: Invalid JSON format for arguments", err=True)
+            tool_args = json_loads(arguments)
+        except JSONDecodeError:
+            click.echo(_MSG_INVALID_ARGUMENTS, err=True)
             sys.exit(1)
     
     try:
-        # Set up security if enabled
-        security_manager = None
-        if not disable_security:
-            if lakera_api_key:
-                os.environ['LAKERA_GUARD_API_KEY'] = lakera_api_key
-            try:
-                security_manager = SecurityManager()
-                click.echo("🔒 Security screening enabled")
-            except ValueError as e:
-                click.echo(f"⚠️  Security disabled: {e}", err=True)
-        else:
-            click.echo("⚠️  Security screening disabled")
-        
-        with MCPClient(server_url, timeout, security_manager, not disable_security) as client:
+        with MCPClient(server_url, timeout, security_manager, enable_security) as client:
             response = client.call_tool(tool_name, tool_args)
             
             if response.error:
                 click.echo(f"Error: {response.error}", err=True)
                 sys.exit(1)
             
-            result = response.result or {}
-            
-            if output:
-                with open(output, 'w') as f:
-                    json.dump(result, f, indent=2)
-                click.echo(f"Tool result saved to {output}")
-            else:
-                click.echo(json.dumps(result, indent=2))
+            write_json(output, response.result or {}, "Tool result")
             
             # Show security stats
             stats = client.get_security_stats()
@@ -197,7 +246,7 @@ def call_tool(server_url: str, tool_name: str, arguments: Optional[str], timeout
                           f"{stats['violations_detected']} violations detected")
                 
     except SecurityViolation as e:
-        click.echo(f"🚨 Security violation: {e}", err=True)
+        click.echo(f"{_SECURITY_VIOLATION_PREFIX}{e}", err=True)
         sys.exit(1)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -206,7 +255,7 @@ def call_tool(server_url: str, tool_name: str, arguments: Optional[str], timeout
 
 # Multi-server commands
 @main.group()
-def multi():
+def multi() -> None:
     """Multi-server operations."""
     pass
 
@@ -219,14 +268,15 @@ def multi():
 @click.option('--priority', '-p', default=0, help='Server priority (higher = preferred)')
 @click.option('--tags', help='Comma-separated tags')
 @click.option('--disabled', is_flag=True, help='Add server as disabled')
-def add_server(name: str, url: str, description: Optional[str], timeout: int, priority: int, tags: Optional[str], disabled: bool):
+def add_server(name: str, url: str, description: Optional[str], timeout: int, priority: int, tags: Optional[str], disabled: bool) -> None:
     """Add a server to the configuration."""
     if not validate_url(url):
-        click.echo(f"Error: Invalid URL format: {url}", err=True)
+        click.echo(_INVALID_URL_PREFIX + url, err=True)
         sys.exit(1)
     
-    tag_list = tags.split(',') if tags else []
-    tag_list = [tag.strip() for tag in tag_list if tag.strip()]
+    from ..config import add_server_config
+    
+    tag_list = [tag for tag in _TAG_SPLIT.split(tags.strip()) if tag] if tags else []
     
     success = add_server_config(
         name=name,
@@ -244,64 +294,60 @@ def add_server(name: str, url: str, description: Optional[str], timeout: int, pr
 
 @multi.command()
 @click.option('--name', '-n', required=True, help='Server name to remove')
-def remove_server(name: str):
+def remove_server(name: str) -> None:
     """Remove a server from the configuration."""
+    from ..config import remove_server_config
+    
     success = remove_server_config(name)
     if not success:
         sys.exit(1)
 
 
 @multi.command()
-def list_servers():
+def list_servers() -> None:
     """List all configured servers."""
+    from ..config import list_server_configs
+    
     servers = list_server_configs()
     
     if not servers:
         click.echo("No servers configured")
         return
     
-    click.echo(f"Configured servers ({len(servers)}):")
+    # Build the listing first and write it in one go
+    lines = [f"Configured servers ({len(servers)}):"]
     for server in servers:
         status = "✅ Enabled" if server.enabled else "❌ Disabled"
-        click.echo(f"  - {server.name} ({server.url}) [{status}]")
+        lines.append(f"  - {server.name} ({server.url}) [{status}]")
         if server.description:
-            click.echo(f"    Description: {server.description}")
+            lines.append(f"    Description: {server.description}")
         if server.tags:
-            click.echo(f"    Tags: {', '.join(server.tags)}")
-        click.echo(f"    Priority: {server.priority}, Timeout: {server.timeout}s")
+            lines.append(f"    Tags: {', '.join(server.tags)}")
+        lines.append(f"    Priority: {server.priority}, Timeout: {server.timeout}s")
+    click.echo("\n".join(lines))
 
 
 @multi.command()
-@click.option('--output', '-o', help='Output file (default: stdout)')
-@click.option('--disable-security', is_flag=True, help='Disable security screening')
-@click.option('--lakera-api-key', help='Lakera API key (overrides LAKERA_GUARD_API_KEY env var)')
-def list_all_tools(output: Optional[str], disable_security: bool, lakera_api_key: Optional[str]):
+@click.option('--output', '-o', type=click.File('wb', lazy=True), help='Save the tools list as JSON to this file')
+@with_security
+def list_all_tools(output: Optional[BinaryIO], security_manager: Optional["SecurityManager"], enable_security: bool) -> None:
     """List all tools from all configured servers."""
-    config = load_config()
-    enabled_servers = [s for s in config.servers if s.enabled]
+    from ..config import load_config
+    
+    enabled_servers = load_config().enabled_servers
     
     if not enabled_servers:
         click.echo("No enabled servers configured")
         return
     
-    # Set up security if enabled
-    security_manager = None
-    if not disable_security:
-        if lakera_api_key:
-            os.environ['LAKERA_GUARD_API_KEY'] = lakera_api_key
-        try:
-            security_manager = SecurityManager()
-            click.echo("🔒 Security screening enabled")
-        except ValueError as e:
-            click.echo(f"⚠️  Security disabled: {e}", err=True)
-    else:
-        click.echo("⚠️  Security screening disabled")
+    from ..core.multi_client import MultiMCPClient
     
     try:
-        with MultiMCPClient(security_manager=security_manager, enable_security=not disable_security) as client:
-            # Add all enabled servers
-            for server_config in enabled_servers:
-                if client.add_server(server_config.url):
+        with MultiMCPClient(security_manager=security_manager, enable_security=enable_security) as client:
+            # Add all enabled servers concurrently, then report in config order
+            results = client.add_servers([s.url for s in enabled_servers])
+            for server_config, added in zip(enabled_servers, results):
+                if added:
                     click.echo(f"✅ Connected to {server_config.name} ({server_config.url})")
                 else:
                     click.echo(f"❌ Failed to connect to {server_config.name} ({server_config.url})")
@@ -310,25 +356,16 @@ def list_all_tools(output: Optional[str], disable_security: bool, lakera_api_key
             tools = client.list_tools()
             
             if output:
-                # Save tool information
-                tool_data = []
-                for tool in tools:
-                    tool_data.append({
-                        "name": tool.name,
-                        "description": tool.description,
-                        "server": tool.server_url,
-                        "parameters": tool.parameters
-                    })
-                
-                with open(output, 'w') as f:
-                    json.dump(tool_data, f, indent=2)
-                click.echo(f"Tools list saved to {output}")
+                # Serialise the tools directly rather than via a list of dicts
+                write_json(output, tools, "Tools list", default=_tool_default)
             else:
                 if tools:
-                    click.echo(f"\nFound {len(tools)} tool(s) across {len(client.servers)} server(s):")
-                    for tool in tools:
-                        click.echo(f"  - {tool.name}: {tool.description}")
-                        click.echo(f"    Server: {tool.server_url}")
+                    lines = [f"\nFound {len(tools)} tool(s) across {len(client.servers)} server(s):"]
+                    lines.extend(
+                        f"  - {tool.name}: {tool.description}\n    Server: {tool.server_url}"
+                        for tool in tools
+                    )
+                    click.echo("\n".join(lines))
                 else:
                     click.echo("No tools available")
             
@@ -344,13 +381,15 @@ def list_all_tools(output: Optional[str], disable_security: bool, lakera_api_key
 @multi.command()
 @click.option('--tool-name', '-n', required=True, help='Name of the tool to call')
 @click.option('--arguments', '-a', help='Tool arguments as JSON string')
-@click.option('--output', '-o', help='Output file (default: stdout)')
-@click.option('--disable-security', is_flag=True, help='Disable security screening')
-@click.option('--lakera-api-key', help='Lakera API key (overrides LAKERA_GUARD_API_KEY env var)')
-def call_tool_multi(tool_name: str, arguments: Optional[str], output: Optional[str], disable_security: bool, lakera_api_key: Optional[str]):
+@click.option('--output', '-o', type=click.File('wb', lazy=True), default='-', help='Output file (default: stdout)')
+@click.option('--mode', '-m', type=click.Choice(['first', 'race', 'all']), default='first',
+              help='Call the first matching server, race all of them, or call all of them')
+@with_security
+def call_tool_multi(tool_name: str, arguments: Optional[str], output: BinaryIO, mode: str, security_manager: Optional["SecurityManager"], enable_security: bool) -> None:
     """Call a tool by name across all configured servers."""
-    config = load_config()
-    enabled_servers = [s for s in config.servers if s.enabled]
+    from ..config import load_config
+    
+    enabled_servers = load_config().enabled_servers
     
     if not enabled_servers:
         click.echo("No enabled servers configured")
@@ -360,29 +399,18 @@ def call_tool_multi(tool_name: str, arguments: Optional[str], output: Optional[s
     tool_args = {}
     if arguments:
         try:
-            tool_args = json.loads(arguments)
-        except json.JSONDecodeError:
-            click.echo("Error: Invalid JSON format for arguments", err=True)
+            tool_args = json_loads(arguments)
+        except JSONDecodeError:
+            click.echo(_MSG_INVALID_ARGUMENTS, err=True)
             sys.exit(1)
     
-    # Set up security if enabled
-    security_manager = None
-    if not disable_security:
-        if lakera_api_key:
-            os.environ['LAKERA_GUARD_API_KEY'] = lakera_api_key
-        try:
-            security_manager = SecurityManager()
-            click.echo("🔒 Security screening enabled")
-        except ValueError as e:
-            click.echo(f"⚠️  Security disabled: {e}", err=True)
-    else:
-        click.echo("⚠️  Security screening disabled")
+    from ..core.multi_client import MultiMCPClient
+    from ..security import SecurityViolation
     
     try:
-        with MultiMCPClient(security_manager=security_manager, enable_security=not disable_security) as client:
-            # Add all enabled servers
-            for server_config in enabled_servers:
-                client.add_server(server_config.url)
+        with MultiMCPClient(security_manager=security_manager, enable_security=enable_security) as client:
+            # Add all enabled servers concurrently
+            client.add_servers([s.url for s in enabled_servers])
             
             # Find the tool
             tool = client.find_tool(tool_name)
@@ -390,30 +418,34 @@ def call_tool_multi(tool_name: str, arguments: Optional[str], output: Optional[s
                 click.echo(f"Error: Tool '{tool_name}' not found on any server")
                 sys.exit(1)
             
-            click.echo(f"Found tool '{tool_name}' on server {tool.server_url}")
+            # Other modes call every server that provides the tool
+            if mode == 'first':
+                click.echo(f"Found tool '{tool_name}' on server {tool.server_url}")
             
             # Call the tool
-            response = client.call_tool(tool_name, tool_args)
-            
-            if response.error:
-                click.echo(f"Error: {response.error}", err=True)
-                sys.exit(1)
+            response = client.call_tool(tool_name, tool_args, mode=mode)
             
-            result = response.result or {}
-            
-            if output:
-                with open(output, 'w') as f:
-                    json.dump(result, f, indent=2)
-                click.echo(f"Tool result saved to {output}")
+            if mode == 'all':
+                # Broadcast results are reported per server
+                result = {
+                    url: {"result": server_response.result, "error": server_response.error}
+                    for url, server_response in response.items()
+                }
             else:
-                click.echo(json.dumps(result, indent=2))
+                if response.error:
+                    click.echo(f"Error: {response.error}", err=True)
+                    sys.exit(1)
+                
+                result = response.result or {}
+            
+            write_json(output, result, "Tool result")
             
             # Show statistics
             stats = client.get_stats()
             click.echo(f"\n📊 Statistics: {stats['requests_routed']} requests routed")
             
     except SecurityViolation as e:
-        click.echo(f"🚨 Security violation: {e}", err=True)
+        click.echo(f"{_SECURITY_VIOLATION_PREFIX}{e}", err=True)
         sys.exit(1)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -425,15 +457,12 @@ def call_tool_multi(tool_name: str, arguments: Optional[str], output: Optional[s
 @click.option('--content', '-c', required=True, help='Content to screen')
 @click.option('--lakera-api-key', help='Lakera API key (overrides LAKERA_GUARD_API_KEY env var)')
 @click.option('--detailed', is_flag=True, help='Show detailed threat categories')
-def screen(content: str, lakera_api_key: Optional[str], detailed: bool):
+def screen(content: str, lakera_api_key: Optional[str], detailed: bool) -> None:
     """Screen content using Lakera Guard."""
     try:
-        if lakera_api_key:
-            os.environ['LAKERA_GUARD_API_KEY'] = lakera_api_key
-        
         from ..security import LakeraClient
         
-        with LakeraClient() as client:
+        with LakeraClient(api_key=lakera_api_key) as client:
             response = client.screen_content(content, include_dev_info=detailed)
             
             if response.flagged:
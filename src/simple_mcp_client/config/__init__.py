@@ -4,6 +4,28 @@ Configuration management for the Simple MCP Client.
 This module provides configuration management for multiple MCP servers.
 """
 
-from .server_config import ServerConfig, load_config, save_config
+from .server_config import (
+    ClientConfig,
+    ServerConfig,
+    add_server_config,
+    add_server_configs,
+    clear_config_cache,
+    get_server_config,
+    list_server_configs,
+    load_config,
+    remove_server_config,
+    save_config,
+)
 
-__all__ = ["ServerConfig", "load_config", "save_config"] 
\ No newline at end of file
+__all__ = [
+    "ClientConfig",
+    "ServerConfig",
+    "add_server_config",
+    "add_server_configs",
+    "clear_config_cache",
+    "get_server_config",
+    "list_server_configs",
+    "load_config",
+    "remove_server_config",
+    "save_config",
+] 
\ No newline at end of file
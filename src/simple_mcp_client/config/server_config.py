@@ -4,16 +4,25 @@ Server configuration management.
 This module provides configuration management for multiple MCP servers.
 """
 
-import json
+import functools
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from ..utils.json_fast import loads as json_loads
 
 
 class ServerConfig(BaseModel):
-    """Configuration for a single MCP server."""
+    """
+    Configuration for a single MCP server.
+    
+    Server configurations are immutable because the same instance is held
+    by the ClientConfig servers list and by its name and URL lookups.
+    """
+    
+    model_config = ConfigDict(frozen=True)
     
     name: str = Field(..., description="Human-readable name for the server")
     url: str = Field(..., description="Server URL")
@@ -26,7 +35,13 @@ class ServerConfig(BaseModel):
 
 
 class ClientConfig(BaseModel):
-    """Configuration for the MCP client."""
+    """
+    Configuration for the MCP client.
+    
+    Servers are looked up by name or URL through dictionaries built on first
+    use. Use add_server and remove_server to change servers so the lookups
+    stay current; assigning a new servers list also resets them.
+    """
     
     servers: List[ServerConfig] = Field(default_factory=list, description="List of server configurations")
     default_timeout: int = Field(default=30, description="Default timeout for servers")
@@ -34,6 +49,98 @@ class ClientConfig(BaseModel):
     security_fail_on_violation: bool = Field(default=True, description="Fail on security violations")
     auto_discover: bool = Field(default=True, description="Automatically discover tools on server addition")
     refresh_interval: Optional[int] = Field(default=None, description="Tool refresh interval in seconds")
+    
+    @functools.cached_property
+    def enabled_servers(self) -> Tuple[ServerConfig, ...]:
+        """
+        Enabled servers in configuration order.
+        
+        Computed on first access and reset whenever servers change through
+        add_server, remove_server or assignment.
+        """
+        return tuple(server for server in self.servers if server.enabled)
+    
+    _by_name: Optional[Dict[str, ServerConfig]] = PrivateAttr(default=None)
+    _by_url: Optional[Dict[str, ServerConfig]] = PrivateAttr(default=None)
+    
+    def _index(self) -> Tuple[Dict[str, ServerConfig], Dict[str, ServerConfig]]:
+        """Get the name and URL lookups, building them on first use."""
+        if self._by_name is None or self._by_url is None:
+            # Iterate in reverse so the first server wins on duplicates
+            self._by_name = {server.name: server for server in reversed(self.servers)}
+            self._by_url = {server.url: server for server in reversed(self.servers)}
+        return self._by_name, self._by_url
+    
+    def _servers_changed(self):
+        """Drop everything derived from the servers list."""
+        self._by_name = None
+        self._by_url = None
+        self.__dict__.pop("enabled_servers", None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "servers":
+            self._servers_changed()
+    
+    def get_server(self, name: str) -> Optional[ServerConfig]:
+        """
+        Get a server configuration by name.
+        
+        Args:
+            name: Server name
+            
+        Returns:
+            ServerConfig if found, None otherwise
+        """
+        return self._index()[0].get(name)
+    
+    def has_server(self, name: Optional[str] = None, url: Optional[str] = None) -> bool:
+        """
+        Check whether a server with the given name or URL is configured.
+        
+        Args:
+            name: Server name to look for
+            url: Server URL to look for
+            
+        Returns:
+            True if either the name or the URL is already configured
+        """
+        by_name, by_url = self._index()
+        return name in by_name or url in by_url
+    
+    def add_server(self, server: ServerConfig):
+        """
+        Append a server configuration.
+        
+        Args:
+            server: Server configuration to add
+        """
+        by_name, by_url = self._index()
+        self.servers.append(server)
+        by_name.setdefault(server.name, server)
+        by_url.setdefault(server.url, server)
+        self.__dict__.pop("enabled_servers", None)
+    
+    def remove_server(self, name: str) -> Optional[ServerConfig]:
+        """
+        Remove a server configuration by name.
+        
+        Args:
+            name: Server name to remove
+            
+        Returns:
+            The removed ServerConfig, or None if no server has that name
+        """
+        server = self.get_server(name)
+        if server is None:
+            return None
+        
+        for i, candidate in enumerate(self.servers):
+            if candidate is server:
+                del self.servers[i]
+                break
+        self._servers_changed()
+        return server
 
 
 def get_config_path() -> Path:
@@ -43,10 +150,50 @@ def get_config_path() -> Path:
     return config_dir / "config.json"
 
 
+# (mtime_ns, size) of the last version of each file written by save_config
+_written_versions: Dict[Path, Tuple[int, int]] = {}
+
+
+def _read_config(config_path: Path, trusted: bool = False) -> ClientConfig:
+    """
+    Read a configuration file.
+    
+    Trusted files were written by save_config from an already validated
+    config, so they are built with model_construct instead of being
+    validated again.
+    """
+    try:
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        
+        if trusted:
+            settings = json_loads(data)
+            servers = [ServerConfig.model_construct(**server) for server in settings.pop("servers", [])]
+            return ClientConfig.model_construct(servers=servers, **settings)
+        
+        # pydantic-core parses the bytes directly, without a Python dict in between
+        return ClientConfig.model_validate_json(data)
+    except Exception as e:
+        print(f"Error loading config from {config_path}: {e}")
+        return ClientConfig()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: Path, mtime_ns: int, size: int) -> ClientConfig:
+    """Parse a config file once per version; the stat fields key the cache."""
+    trusted = _written_versions.get(config_path) == (mtime_ns, size)
+    return _read_config(config_path, trusted)
+
+
 def load_config(config_path: Optional[Path] = None) -> ClientConfig:
     """
     Load configuration from file.
     
+    The parsed file is cached until its modification time or size changes,
+    or it is rewritten through save_config. Each call returns a fresh
+    shallow copy, so callers may change settings and servers. Files edited
+    outside save_config are always validated.
+    
     Args:
         config_path: Path to configuration file, or None for default
         
@@ -56,23 +203,33 @@ def load_config(config_path: Optional[Path] = None) -> ClientConfig:
     if config_path is None:
         config_path = get_config_path()
     
-    if not config_path.exists():
+    try:
+        stat = os.stat(config_path)
+    except OSError:
         # Return default configuration
         return ClientConfig()
     
-    try:
-        with open(config_path, 'r') as f:
-            data = json.load(f)
-        return ClientConfig(**data)
-    except Exception as e:
-        print(f"Error loading config from {config_path}: {e}")
-        return ClientConfig()
+    cached = _load_config_cached(config_path, stat.st_mtime_ns, stat.st_size)
+    
+    # Server configs are frozen, so a new servers list is all a copy needs;
+    # the copied lookups would still point into the cached config's dicts
+    config = cached.model_copy(update={"servers": list(cached.servers)})
+    config._servers_changed()
+    return config
+
+
+def clear_config_cache():
+    """Discard all cached configuration files."""
+    _load_config_cached.cache_clear()
 
 
 def save_config(config: ClientConfig, config_path: Optional[Path] = None):
     """
     Save configuration to file.
     
+    The file is written to a temporary sibling and moved into place, so a
+    crash mid-write leaves the previous version intact.
+    
     Args:
         config: ClientConfig instance to save
         config_path: Path to configuration file, or None for default
@@ -80,12 +237,24 @@ def save_config(config: ClientConfig, config_path: Optional[Path] = None):
     if config_path is None:
         config_path = get_config_path()
     
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
     try:
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(config.model_dump(), f, indent=2)
+        with open(tmp_path, 'wb') as f:
+            f.write(config.model_dump_json(indent=2).encode())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
+        stat = os.stat(config_path)
+        _written_versions[config_path] = (stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         print(f"Error saving config to {config_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    finally:
+        clear_config_cache()
 
 
 def add_server_config(
@@ -114,30 +283,68 @@ def add_server_config(
     Returns:
         True if added successfully, False otherwise
     """
+    return add_server_configs([{
+        "name": name,
+        "url": url,
+        "description": description,
+        "enabled": enabled,
+        "timeout": timeout,
+        "priority": priority,
+        "tags": tags,
+    }], config_path)[0]
+
+
+def add_server_configs(
+    servers: List[Dict[str, Any]],
+    config_path: Optional[Path] = None
+) -> List[bool]:
+    """
+    Add several server configurations with a single load and save.
+    
+    Servers whose name or URL is already configured are skipped, which makes
+    repeated calls with the same list idempotent.
+    
+    Args:
+        servers: Server settings, each using the keyword arguments of add_server_config
+        config_path: Configuration file path
+        
+    Returns:
+        List with one entry per server, True if it was added
+    """
     config = load_config(config_path)
     
-    # Check if server already exists
-    for server in config.servers:
-        if server.name == name or server.url == url:
+    results = []
+    for settings in servers:
+        name = settings["name"]
+        url = settings["url"]
+        
+        # Check if server already exists
+        if config.has_server(name, url):
             print(f"Server with name '{name}' or URL '{url}' already exists")
-            return False
-    
-    # Create new server config
-    server_config = ServerConfig(
-        name=name,
-        url=url,
-        description=description,
-        enabled=enabled,
-        timeout=timeout,
-        priority=priority,
-        tags=tags or []
-    )
-    
-    config.servers.append(server_config)
-    save_config(config, config_path)
+            results.append(False)
+            continue
+        
+        # Create new server config
+        server_config = ServerConfig(
+            name=name,
+            url=url,
+            description=settings.get("description"),
+            enabled=settings.get("enabled", True),
+            timeout=settings.get("timeout", 30),
+            priority=settings.get("priority", 0),
+            tags=settings.get("tags") or []
+        )
+        
+        config.add_server(server_config)
+        results.append(True)
     
-    print(f"Added server '{name}' ({url})")
-    return True
+    if any(results):
+        save_config(config, config_path)
+        for settings, added in zip(servers, results):
+            if added:
+                print(f"Added server '{settings['name']}' ({settings['url']})")
+    
+    return results
 
 
 def remove_server_config(name: str, config_path: Optional[Path] = None) -> bool:
@@ -153,15 +360,14 @@ def remove_server_config(name: str, config_path: Optional[Path] = None) -> bool:
     """
     config = load_config(config_path)
     
-    for i, server in enumerate(config.servers):
-        if server.name == name:
-            removed_server = config.servers.pop(i)
-            save_config(config, config_path)
-            print(f"Removed server '{removed_server.name}' ({removed_server.url})")
-            return True
+    removed_server = config.remove_server(name)
+    if removed_server is None:
+        print(f"Server '{name}' not found")
+        return False
     
-    print(f"Server '{name}' not found")
-    return False
+    save_config(config, config_path)
+    print(f"Removed server '{removed_server.name}' ({removed_server.url})")
+    return True
 
 
 def list_server_configs(config_path: Optional[Path] = None) -> List[ServerConfig]:
@@ -189,10 +395,4 @@ def get_server_config(name: str, config_path: Optional[Path] = None) -> Optional
     Returns:
         ServerConfig if found, None otherwise
     """
-    config = load_config(config_path)
-    
-    for server in config.servers:
-        if server.name == name:
-            return server
-    
-    return None 
\ No newline at end of file
+    return load_config(config_path).get_server(name) 
\ No newline at end of file
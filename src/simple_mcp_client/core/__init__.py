@@ -4,6 +4,31 @@ Core functionality for the Simple MCP Client.
 This module contains the main client implementation and related core components.
 """
 
-from .client import MCPClient
+import importlib
 
-__all__ = ["MCPClient"] 
\ No newline at end of file
+__all__ = ["AsyncMCPClient", "MCPClient", "MultiMCPClient", "ToolNotFoundError"]
+
+# Imported on first access (PEP 562), so importing one client module does not
+# load the others, nor aiohttp through the async client
+_LAZY_IMPORTS = {
+    "AsyncMCPClient": ".async_client",
+    "MCPClient": ".client",
+    "MultiMCPClient": ".multi_client",
+    "ToolNotFoundError": ".multi_client",
+}
+
+
+def __getattr__(name):
+    """Import public names lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,235 @@
+"""
+Asynchronous MCP client implementation.
+
+This module provides an asyncio-based client for sending concurrent requests
+to an MCP server. It requires the optional ``aiohttp`` dependency.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+from urllib.parse import urljoin
+
+from .client import MCPRequest, MCPResponse
+from ..security import SecurityManager, SecurityViolation
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncMCPClient:
+    """
+    An asyncio client for interacting with MCP (Model Context Protocol) servers.
+
+    This client mirrors the MCPClient interface with coroutine methods, so
+    independent requests can run concurrently with ``asyncio.gather``. A single
+    pooled keep-alive connector is shared by all requests. Security screening
+    runs in the default executor so it does not block the event loop.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        timeout: int = 30,
+        security_manager: Optional[SecurityManager] = None,
+        enable_security: bool = True,
+        connection_limit: int = 8,
+        keepalive_timeout: int = 30
+    ):
+        """
+        Initialize the async MCP client.
+
+        Args:
+            server_url: The URL of the MCP server
+            timeout: Request timeout in seconds
+            security_manager: Security manager instance (will create one if not provided)
+            enable_security: Whether to enable security screening
+            connection_limit: Maximum number of simultaneous connections
+            keepalive_timeout: Seconds to keep idle connections open
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncMCPClient requires aiohttp. "
+                "Install it with: pip install 'simple-mcp-client[async]'"
+            )
+
+        self.server_url = server_url.rstrip('/')
+        # Resolved once; the health check always lives at the server root
+        self._health_url = urljoin(self.server_url, '/health')
+        self.timeout = timeout
+        self.enable_security = enable_security
+        self.connection_limit = connection_limit
+        self.keepalive_timeout = keepalive_timeout
+
+        # Initialize security manager if enabled
+        self.security_manager = None
+        if self.enable_security:
+            self.security_manager = security_manager or SecurityManager()
+
+        # The session must be created inside a running event loop
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """The pooled HTTP session, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    keepalive_timeout=self.keepalive_timeout
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/json'
+                }
+            )
+        return self._session
+
+    async def _screen_interaction(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+        screen_request: bool = True
+    ):
+        """Run the blocking security screening without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            self.security_manager.screen_server_interaction,
+            method,
+            params,
+            response_data,
+            screen_request
+        )
+
+    async def connect(self) -> bool:
+        """
+        Test the connection to the MCP server.
+
+        Returns:
+            True if connection is successful, False otherwise
+        """
+        try:
+            async with self.session.get(self._health_url) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Failed to connect to MCP server: {e}")
+            return False
+
+    async def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> MCPResponse:
+        """
+        Send a request to the MCP server with security screening.
+
+        Args:
+            method: The MCP method to call
+            params: Optional parameters for the request
+
+        Returns:
+            MCPResponse object containing the server response
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+            SecurityViolation: If security screening detects a threat
+        """
+        # Security screening for the request
+        if self.security_manager:
+            try:
+                await self._screen_interaction(method, params)
+            except SecurityViolation as e:
+                logger.error(f"Security violation detected in request: {e}")
+                raise
+
+        request_data = MCPRequest(
+            method=method,
+            params=params or {},
+            id="1"  # Simple ID for now
+        )
+
+        try:
+            # Serialise and validate with pydantic-core rather than stdlib json
+            async with self.session.post(self.server_url, data=request_data.model_dump_json()) as response:
+                response.raise_for_status()
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Request failed: {e}")
+            raise
+
+        mcp_response = MCPResponse.model_validate_json(body)
+
+        # Security screening for the response
+        if self.security_manager and mcp_response.result:
+            try:
+                await self._screen_interaction(method, params, mcp_response.result, screen_request=False)
+            except SecurityViolation as e:
+                logger.error(f"Security violation detected in response: {e}")
+                raise
+
+        return mcp_response
+
+    async def list_tools(self) -> MCPResponse:
+        """
+        List available tools from the MCP server with security screening.
+
+        Returns:
+            MCPResponse containing the list of tools (filtered for security)
+        """
+        response = await self.send_request("tools/list")
+
+        # Apply security screening to tools list
+        if self.security_manager and response.result:
+            tools = response.result.get('tools', [])
+            loop = asyncio.get_running_loop()
+            response.result['tools'] = await loop.run_in_executor(
+                None, self.security_manager.screen_tools_list, tools
+            )
+
+        return response
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> MCPResponse:
+        """
+        Call a specific tool on the MCP server with security screening.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Arguments to pass to the tool
+
+        Returns:
+            MCPResponse containing the tool result
+        """
+        return await self.send_request("tools/call", {
+            "name": tool_name,
+            "arguments": arguments
+        })
+
+    def get_security_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Get security screening statistics.
+
+        Returns:
+            Dictionary with screening statistics or None if security is disabled
+        """
+        if self.security_manager:
+            return self.security_manager.get_screening_stats()
+        return None
+
+    async def close(self):
+        """Close the client session and security manager."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self.security_manager:
+            self.security_manager.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
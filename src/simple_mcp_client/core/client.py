@@ -6,13 +6,15 @@ This module provides the main client class for interacting with MCP servers.
 
 import json
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
 from pydantic import BaseModel, Field
 
 from ..security import SecurityManager, SecurityViolation
+from ..utils.helpers import create_session
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +49,9 @@ class MCPClient:
         server_url: str,
         timeout: int = 30,
         security_manager: Optional[SecurityManager] = None,
-        enable_security: bool = True
+        enable_security: bool = True,
+        http_session: Optional[requests.Session] = None,
+        tools_cache_ttl: Optional[float] = None
     ):
         """
         Initialize the MCP client.
@@ -57,17 +61,28 @@ class MCPClient:
             timeout: Request timeout in seconds
             security_manager: Security manager instance (will create one if not provided)
             enable_security: Whether to enable security screening
+            http_session: Pre-configured session to reuse (the caller keeps ownership)
+            tools_cache_ttl: Seconds to reuse a list_tools response (None disables caching)
         """
         self.server_url = server_url.rstrip('/')
+        # Resolved once; the health check always lives at the server root
+        self._health_url = urljoin(self.server_url, '/health')
         self.timeout = timeout
         self.enable_security = enable_security
+        self.tools_cache_ttl = tools_cache_ttl
+        self._tools_cache: Optional[Tuple[float, MCPResponse]] = None
+        # (tools screened, violations) when list_tools last logged them
+        self._logged_screening_totals: Tuple[int, int] = (0, 0)
         
         # Initialize security manager if enabled
         self.security_manager = None
         if self.enable_security:
             self.security_manager = security_manager or SecurityManager()
         
-        self.session = requests.Session()
+        # Reuse a caller-provided session so pooled keep-alive connections
+        # can be shared; only sessions we create here are closed by close()
+        self._owns_session = http_session is None
+        self.session = http_session or create_session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
@@ -82,7 +97,7 @@ class MCPClient:
         """
         try:
             response = self.session.get(
-                urljoin(self.server_url, '/health'),
+                self._health_url,
                 timeout=self.timeout
             )
             return response.status_code == 200
@@ -122,19 +137,20 @@ class MCPClient:
         try:
             response = self.session.post(
                 self.server_url,
-                json=request_data.model_dump(),
+                # pydantic-core serialises in compiled code, faster than stdlib json
+                data=request_data.model_dump_json(),
                 timeout=self.timeout
             )
             response.raise_for_status()
             
-            response_data = response.json()
-            mcp_response = MCPResponse(**response_data)
+            # Validate the raw body in pydantic-core, without a dict in between
+            mcp_response = MCPResponse.model_validate_json(response.content)
             
-            # Security screening for the response
+            # Security screening for the response; the request was screened above
             if self.security_manager and mcp_response.result:
                 try:
                     self.security_manager.screen_server_interaction(
-                        method, params, mcp_response.result
+                        method, params, mcp_response.result, screen_request=False
                     )
                 except SecurityViolation as e:
                     logger.error(f"Security violation detected in response: {e}")
@@ -150,9 +166,18 @@ class MCPClient:
         """
         List available tools from the MCP server with security screening.
         
+        When ``tools_cache_ttl`` is set, a successful response is reused until
+        it expires so repeated listings do not hit the server again.
+        
         Returns:
             MCPResponse containing the list of tools (filtered for security)
         """
+        if self._tools_cache is not None:
+            cached_at, cached_response = self._tools_cache
+            if self.tools_cache_ttl is not None and time.monotonic() - cached_at < self.tools_cache_ttl:
+                return cached_response
+            self._tools_cache = None
+        
         response = self.send_request("tools/list")
         
         # Apply security screening to tools list
@@ -161,14 +186,25 @@ class MCPClient:
             safe_tools = self.security_manager.screen_tools_list(tools)
             response.result['tools'] = safe_tools
             
-            # Log screening results
-            stats = self.security_manager.get_screening_stats()
-            if stats['tools_screened'] > 0:
-                logger.info(f"Security screening: {stats['tools_screened']} tools screened, "
-                          f"{stats['violations_detected']} violations detected")
+            # Log the screening done since the last listing, reading the
+            # counters in place rather than copying the stats dict
+            stats = self.security_manager.screening_stats
+            totals = (stats['tools_screened'], stats['violations_detected'])
+            screened = totals[0] - self._logged_screening_totals[0]
+            if screened > 0:
+                logger.info(f"Security screening: {screened} tools screened, "
+                          f"{totals[1] - self._logged_screening_totals[1]} violations detected")
+            self._logged_screening_totals = totals
+        
+        if self.tools_cache_ttl is not None and not response.error:
+            self._tools_cache = (time.monotonic(), response)
         
         return response
     
+    def invalidate_tools_cache(self):
+        """Discard any cached list_tools response."""
+        self._tools_cache = None
+    
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> MCPResponse:
         """
         Call a specific tool on the MCP server with security screening.
@@ -198,7 +234,8 @@ class MCPClient:
     
     def close(self):
         """Close the client session and security manager."""
-        self.session.close()
+        if self._owns_session:
+            self.session.close()
         if self.security_manager:
             self.security_manager.close()
     
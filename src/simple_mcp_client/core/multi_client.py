@@ -5,24 +5,54 @@ This module provides a client that can manage multiple MCP servers
 and intelligently route tool requests to the appropriate server.
 """
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Set
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set, Union
 from urllib.parse import urlparse
 
-from .client import MCPClient
+import requests
+
+from .client import MCPClient, MCPResponse
 from ..security import SecurityManager, SecurityViolation
+from ..utils.helpers import create_session
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on worker threads used to fan requests out across servers
+MAX_FAN_OUT_WORKERS = 32
+
+# Supported call_tool routing modes
+CALL_MODES = ("first", "race", "all")
+
+
+class ToolNotFoundError(ValueError):
+    """Exception raised when a tool is not available on any server."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_url(server_url: str) -> str:
+    """Reduce a server URL to its scheme and network location."""
+    parsed_url = urlparse(server_url)
+    return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
 
 class MCPTool:
     """Represents a tool available from an MCP server."""
     
+    # Many tools are kept at once, so skip the per-instance __dict__
+    __slots__ = ("name", "description", "server_url", "parameters", "_name_lower", "_description_lower")
+    
     def __init__(self, name: str, description: str, server_url: str, parameters: Optional[Dict[str, Any]] = None):
         self.name = name
         self.description = description
         self.server_url = server_url
         self.parameters = parameters or {}
+        
+        # Lowercased once here so search_tools only does substring checks
+        self._name_lower = name.lower()
+        self._description_lower = description.lower()
     
     def __repr__(self):
         return f"MCPTool(name='{self.name}', server='{self.server_url}')"
@@ -31,10 +61,14 @@ class MCPTool:
 class MCPServer:
     """Represents an MCP server with its tools."""
     
+    __slots__ = ("url", "client", "tools", "tool_names", "connected")
+    
     def __init__(self, url: str, client: MCPClient):
         self.url = url
         self.client = client
         self.tools: List[MCPTool] = []
+        # Names of the tools above, for constant-time membership checks
+        self.tool_names: Set[str] = set()
         self.connected = False
     
     def __repr__(self):
@@ -47,16 +81,20 @@ class MultiMCPClient:
     
     This client provides:
     - Multiple server management
-    - Tool discovery across all servers
+    - Concurrent tool discovery across all servers
     - Intelligent tool routing
     - Unified tool interface
+    
+    All server clients share one pooled HTTP session, so keep-alive
+    connections are reused across servers and requests.
     """
     
     def __init__(
         self,
         security_manager: Optional[SecurityManager] = None,
         enable_security: bool = True,
-        timeout: int = 30
+        timeout: int = 30,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize the multi-server MCP client.
@@ -65,6 +103,8 @@ class MultiMCPClient:
             security_manager: Security manager instance
             enable_security: Whether to enable security screening
             timeout: Request timeout in seconds
+            http_session: Session shared by all server clients (the caller keeps
+                ownership); one is created and closed by this client if not given
         """
         self.servers: Dict[str, MCPServer] = {}
         self.tools: Dict[str, MCPTool] = {}
@@ -72,6 +112,15 @@ class MultiMCPClient:
         self.enable_security = enable_security
         self.timeout = timeout
         
+        self._owns_session = http_session is None
+        self.http_session = http_session or create_session(
+            pool_maxsize=MAX_FAN_OUT_WORKERS,
+            pool_connections=MAX_FAN_OUT_WORKERS
+        )
+        
+        # Guards the server/tool registries so servers can be added concurrently
+        self._lock = threading.RLock()
+        
         # Statistics
         self.stats = {
             "servers_added": 0,
@@ -91,20 +140,20 @@ class MultiMCPClient:
             True if server was added successfully, False otherwise
         """
         try:
-            # Normalize URL
-            parsed_url = urlparse(server_url)
-            normalized_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            normalized_url = _normalize_url(server_url)
             
-            if normalized_url in self.servers:
-                logger.warning(f"Server {normalized_url} already exists")
-                return False
+            with self._lock:
+                if normalized_url in self.servers:
+                    logger.warning(f"Server {normalized_url} already exists")
+                    return False
             
             # Create client for this server
             client = MCPClient(
                 normalized_url,
                 timeout=self.timeout,
                 security_manager=self.security_manager,
-                enable_security=self.enable_security
+                enable_security=self.enable_security,
+                http_session=self.http_session
             )
             
             # Test connection
@@ -116,12 +165,21 @@ class MultiMCPClient:
             server = MCPServer(normalized_url, client)
             server.connected = True
             
-            # Discover tools
-            self._discover_tools(server)
+            # Discover tools; they are indexed only once the server is registered
+            tools = self._fetch_tools(server)
+            
+            # Add to servers, unless a concurrent add already registered it
+            with self._lock:
+                duplicate = normalized_url in self.servers
+                if not duplicate:
+                    self.servers[normalized_url] = server
+                    self._index_tools(server, tools or [])
+                    self.stats["servers_added"] += 1
             
-            # Add to servers
-            self.servers[normalized_url] = server
-            self.stats["servers_added"] += 1
+            if duplicate:
+                logger.warning(f"Server {normalized_url} already exists")
+                client.close()
+                return False
             
             logger.info(f"Added server {normalized_url} with {len(server.tools)} tools")
             return True
@@ -130,6 +188,29 @@ class MultiMCPClient:
             logger.error(f"Error adding server {server_url}: {e}")
             return False
     
+    def add_servers(self, server_urls: List[str]) -> List[bool]:
+        """
+        Add several MCP servers concurrently.
+        
+        Connection checks and tool discovery run in parallel, so the total
+        latency is bounded by the slowest server rather than their sum.
+        
+        Args:
+            server_urls: URLs of the MCP servers
+            
+        Returns:
+            List of results in the same order as server_urls
+        """
+        return self._fan_out(self.add_server, server_urls)
+    
+    def _fan_out(self, func, items: List[Any]) -> List[Any]:
+        """Apply func to each item in a thread pool, preserving input order."""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_FAN_OUT_WORKERS, len(items))) as executor:
+            return list(executor.map(func, items))
+    
     def remove_server(self, server_url: str) -> bool:
         """
         Remove an MCP server from the client.
@@ -140,51 +221,85 @@ class MultiMCPClient:
         Returns:
             True if server was removed successfully, False otherwise
         """
-        parsed_url = urlparse(server_url)
-        normalized_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        
-        if normalized_url not in self.servers:
-            return False
-        
-        server = self.servers[normalized_url]
+        normalized_url = _normalize_url(server_url)
         
-        # Remove tools from this server
-        tools_to_remove = [name for name, tool in self.tools.items() if tool.server_url == normalized_url]
-        for tool_name in tools_to_remove:
-            del self.tools[tool_name]
+        with self._lock:
+            if normalized_url not in self.servers:
+                return False
+            
+            server = self.servers.pop(normalized_url)
+            
+            self._unindex_tools(server)
         
-        # Close client and remove server
+        # Close client outside the lock
         server.client.close()
-        del self.servers[normalized_url]
         
         logger.info(f"Removed server {normalized_url}")
         return True
     
-    def _discover_tools(self, server: MCPServer):
-        """Discover tools from a server."""
+    def _unindex_tools(self, server: MCPServer):
+        """
+        Drop a server's tools from the name index.
+        
+        Only entries still pointing at this server's tools are removed, so a
+        tool of the same name registered by another server is kept. The
+        caller must hold the lock.
+        """
+        for tool in server.tools:
+            if self.tools.get(tool.name) is tool:
+                del self.tools[tool.name]
+    
+    def _fetch_tools(self, server: MCPServer) -> Optional[List[MCPTool]]:
+        """
+        Fetch a server's tools without touching the shared tool index.
+        
+        Args:
+            server: Server to query
+            
+        Returns:
+            The server's tools, or None if they could not be listed
+        """
         try:
+            server.client.invalidate_tools_cache()
             response = server.client.list_tools()
             if response.error:
                 logger.error(f"Error listing tools from {server.url}: {response.error}")
-                return
-            
-            tools_data = response.result.get('tools', [])
-            server.tools.clear()
+                return None
             
-            for tool_data in tools_data:
-                tool = MCPTool(
+            return [
+                MCPTool(
                     name=tool_data.get('name', 'Unknown'),
                     description=tool_data.get('description', ''),
                     server_url=server.url,
                     parameters=tool_data.get('parameters')
                 )
-                
-                server.tools.append(tool)
-                self.tools[tool.name] = tool
-                self.stats["tools_discovered"] += 1
+                for tool_data in response.result.get('tools', [])
+            ]
             
         except Exception as e:
             logger.error(f"Error discovering tools from {server.url}: {e}")
+            return None
+    
+    def _index_tools(self, server: MCPServer, tools: List[MCPTool]):
+        """Replace a server's tools and index them by name. The caller must hold the lock."""
+        self._unindex_tools(server)
+        server.tools = tools
+        server.tool_names = {tool.name for tool in tools}
+        
+        for tool in tools:
+            self.tools[tool.name] = tool
+        self.stats["tools_discovered"] += len(tools)
+    
+    def _discover_tools(self, server: MCPServer):
+        """Discover tools from a registered server."""
+        tools = self._fetch_tools(server)
+        if tools is None:
+            return
+        
+        with self._lock:
+            # Skip servers removed while their tools were being fetched
+            if self.servers.get(server.url) is server:
+                self._index_tools(server, tools)
     
     def refresh_tools(self, server_url: Optional[str] = None):
         """
@@ -194,15 +309,15 @@ class MultiMCPClient:
             server_url: Specific server URL to refresh, or None for all servers
         """
         if server_url:
-            parsed_url = urlparse(server_url)
-            normalized_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            normalized_url = _normalize_url(server_url)
             
             if normalized_url in self.servers:
                 self._discover_tools(self.servers[normalized_url])
         else:
-            # Refresh all servers
-            for server in self.servers.values():
-                self._discover_tools(server)
+            # Refresh all servers concurrently
+            with self._lock:
+                servers = list(self.servers.values())
+            self._fan_out(self._discover_tools, servers)
     
     def list_tools(self) -> List[MCPTool]:
         """
@@ -211,7 +326,8 @@ class MultiMCPClient:
         Returns:
             List of all available tools
         """
-        return list(self.tools.values())
+        with self._lock:
+            return list(self.tools.values())
     
     def find_tool(self, tool_name: str) -> Optional[MCPTool]:
         """
@@ -238,46 +354,134 @@ class MultiMCPClient:
         query_lower = query.lower()
         matches = []
         
-        for tool in self.tools.values():
-            if (query_lower in tool.name.lower() or 
-                query_lower in tool.description.lower()):
+        for tool in self.list_tools():
+            if query_lower in tool._name_lower or query_lower in tool._description_lower:
                 matches.append(tool)
         
         return matches
     
-    def call_tool(self, tool_name: str, arguments: Dict[str, Any]):
+    def _servers_with_tool(self, tool_name: str) -> List[MCPServer]:
+        """Get every connected server that offers a tool, in registration order."""
+        with self._lock:
+            return [
+                server for server in self.servers.values()
+                if tool_name in server.tool_names
+            ]
+    
+    def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        mode: str = "first"
+    ) -> Union[MCPResponse, Dict[str, MCPResponse]]:
         """
         Call a tool by name, automatically routing to the correct server.
         
+        In "first" mode the call goes to the server the tool was registered
+        from. When several servers offer the same tool, "race" calls them all
+        concurrently and returns the first successful response, and "all"
+        broadcasts the call and collects every response.
+        
         Args:
             tool_name: Name of the tool to call
             arguments: Arguments to pass to the tool
+            mode: Routing mode, one of "first", "race" or "all"
             
         Returns:
-            Tool response
+            Tool response, or a dictionary of responses keyed by server URL
+            in "all" mode
             
         Raises:
-            ValueError: If tool is not found
+            ToolNotFoundError: If tool is not found
+            ValueError: If the tool's server is not available or mode is unknown
             SecurityViolation: If security screening detects a threat
         """
+        if mode not in CALL_MODES:
+            raise ValueError(f"Unknown call mode '{mode}', expected one of {', '.join(CALL_MODES)}")
+        
         tool = self.find_tool(tool_name)
         if not tool:
-            raise ValueError(f"Tool '{tool_name}' not found")
+            raise ToolNotFoundError(f"Tool '{tool_name}' not found")
         
-        server = self.servers.get(tool.server_url)
-        if not server:
+        if mode == "first":
+            server = self.servers.get(tool.server_url)
+            if not server:
+                raise ValueError(f"Server for tool '{tool_name}' not available")
+            return self._call_server(server, tool_name, arguments)
+        
+        servers = self._servers_with_tool(tool_name)
+        if not servers:
             raise ValueError(f"Server for tool '{tool_name}' not available")
         
+        if mode == "race":
+            return self._race_call(servers, tool_name, arguments)
+        
+        responses = self._fan_out(
+            lambda server: self._broadcast_call(server, tool_name, arguments),
+            servers
+        )
+        return {server.url: response for server, response in zip(servers, responses)}
+    
+    def _call_server(self, server: MCPServer, tool_name: str, arguments: Dict[str, Any]) -> MCPResponse:
+        """Call a tool on one server, keeping the routing statistics."""
         try:
-            self.stats["requests_routed"] += 1
-            response = server.client.call_tool(tool_name, arguments)
-            return response
+            with self._lock:
+                self.stats["requests_routed"] += 1
+            return server.client.call_tool(tool_name, arguments)
             
         except Exception as e:
-            self.stats["routing_errors"] += 1
-            logger.error(f"Error calling tool '{tool_name}': {e}")
+            with self._lock:
+                self.stats["routing_errors"] += 1
+            logger.error(f"Error calling tool '{tool_name}' on {server.url}: {e}")
             raise
     
+    def _broadcast_call(self, server: MCPServer, tool_name: str, arguments: Dict[str, Any]) -> MCPResponse:
+        """Call a tool on one server, turning request failures into error responses."""
+        try:
+            return self._call_server(server, tool_name, arguments)
+        except SecurityViolation:
+            raise
+        except Exception as e:
+            return MCPResponse(error={"message": str(e)})
+    
+    def _race_call(self, servers: List[MCPServer], tool_name: str, arguments: Dict[str, Any]) -> MCPResponse:
+        """Call a tool on several servers and return the first successful response."""
+        if len(servers) == 1:
+            return self._call_server(servers[0], tool_name, arguments)
+        
+        executor = ThreadPoolExecutor(max_workers=min(MAX_FAN_OUT_WORKERS, len(servers)))
+        pending = {
+            executor.submit(self._call_server, server, tool_name, arguments)
+            for server in servers
+        }
+        last_response: Optional[MCPResponse] = None
+        last_error: Optional[Exception] = None
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        response = future.result()
+                    except SecurityViolation:
+                        raise
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if not response.error:
+                        return response
+                    last_response = response
+        finally:
+            # Drop calls that have not started; running ones finish in the background
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        if last_response is not None:
+            return last_response
+        # Every call completed without a response, so each one raised
+        assert last_error is not None
+        raise last_error
+    
     def get_server_info(self) -> Dict[str, Any]:
         """
         Get information about all servers.
@@ -314,6 +518,8 @@ class MultiMCPClient:
             server.client.close()
         self.servers.clear()
         self.tools.clear()
+        if self._owns_session:
+            self.http_session.close()
     
     def __enter__(self):
         """Context manager entry."""
@@ -5,7 +5,15 @@ This module provides security screening capabilities using Lakera Guard
 to ensure safe interactions with MCP servers.
 """
 
-from .lakera_client import LakeraClient
+from ._factory import get_security_manager
+from .lakera_client import LakeraClient, LakeraGuardRequest, LakeraGuardResponse
 from .security_manager import SecurityManager, SecurityViolation
 
-__all__ = ["LakeraClient", "SecurityManager", "SecurityViolation"] 
\ No newline at end of file
+__all__ = [
+    "LakeraClient",
+    "LakeraGuardRequest",
+    "LakeraGuardResponse",
+    "SecurityManager",
+    "SecurityViolation",
+    "get_security_manager",
+] 
\ No newline at end of file
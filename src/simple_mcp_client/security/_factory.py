@@ -0,0 +1,33 @@
+"""
+Shared security manager factory.
+
+This module provides a process-wide SecurityManager so that repeated
+commands reuse one Lakera client and one verdict cache.
+"""
+
+import functools
+from typing import Optional
+
+from .lakera_client import LakeraClient
+from .security_manager import SecurityManager
+
+
+@functools.lru_cache(maxsize=1)
+def get_security_manager(api_key: Optional[str] = None) -> SecurityManager:
+    """
+    Get the shared security manager, creating it on first use.
+    
+    The manager is built around an injected Lakera client, so closing the
+    clients that use it does not close the shared connection pool. The
+    client does not cache responses; the manager's verdict cache does.
+    
+    Args:
+        api_key: Lakera API key (defaults to LAKERA_GUARD_API_KEY env var)
+        
+    Returns:
+        The shared SecurityManager instance
+        
+    Raises:
+        ValueError: If no Lakera API key is available
+    """
+    return SecurityManager(lakera_client=LakeraClient(api_key=api_key, cache_ttl=None))
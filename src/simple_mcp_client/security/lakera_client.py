@@ -7,14 +7,35 @@ to screen content for security threats.
 
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
 
 import requests
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..utils.helpers import canonical_json, create_session
+from ..utils.ttl_cache import TTLCache, content_key
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent requests when screening items one by one
+MAX_SCREENING_WORKERS = 8
+
+# One keep-alive pool for every LakeraClient in the process, created on first use
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Get the process-wide Lakera session, creating it on first use."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session({"Content-Type": "application/json"})
+        return _shared_session
+
 
 class LakeraGuardRequest(BaseModel):
     """Model for Lakera Guard API requests."""
@@ -24,7 +45,14 @@ class LakeraGuardRequest(BaseModel):
 
 
 class LakeraGuardResponse(BaseModel):
-    """Model for Lakera Guard API responses."""
+    """
+    Model for Lakera Guard API responses.
+    
+    Responses are immutable because one verdict may be shared, both by the
+    results of screen_contents and by the SecurityManager verdict cache.
+    """
+    
+    model_config = ConfigDict(frozen=True)
     
     flagged: bool = Field(..., description="Whether the content was flagged")
     categories: Dict[str, bool] = Field(default_factory=dict, description="Category flags")
@@ -38,6 +66,10 @@ class LakeraClient:
     
     This client provides methods to screen content for various security threats
     including prompt injection, jailbreaking, and other malicious content.
+    Responses are cached briefly by request digest, so repeated checks of the
+    same content skip the HTTPS round trip. All clients send their requests
+    through one shared connection pool, so TLS connections to the API are
+    reused across clients; each client passes its own API key per request.
     """
     
     def __init__(
@@ -45,7 +77,9 @@ class LakeraClient:
         api_key: Optional[str] = None,
         base_url: str = "https://api.lakera.ai/v2",
         region: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        cache_ttl: Optional[float] = 300.0,
+        cache_maxsize: int = 1024
     ):
         """
         Initialize the Lakera client.
@@ -55,6 +89,8 @@ class LakeraClient:
             base_url: Base URL for the Lakera API
             region: Specific region to use (us-east-1, us-west-2, eu-west-1, ap-southeast-1)
             timeout: Request timeout in seconds
+            cache_ttl: Seconds to cache screening responses (None disables caching)
+            cache_maxsize: Maximum number of cached responses
         """
         self.api_key = api_key or os.getenv("LAKERA_GUARD_API_KEY")
         if not self.api_key:
@@ -66,12 +102,13 @@ class LakeraClient:
         else:
             self.base_url = base_url
         
+        # Appended rather than urljoin-ed, which would drop the /v2 path
+        self._guard_url = self.base_url.rstrip("/") + "/guard"
+        
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        })
+        self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        self.session = _get_shared_session()
+        self._response_cache = TTLCache(cache_maxsize, cache_ttl)
     
     def screen_content(
         self,
@@ -91,31 +128,95 @@ class LakeraClient:
         Raises:
             requests.RequestException: If the API request fails
         """
-        # Convert string content to message format
+        # Blank content cannot carry a threat, so skip the round trip
+        if isinstance(content, str) and not content.strip():
+            return LakeraGuardResponse(flagged=False)
+        
+        # Convert string content to message format; messages built here are
+        # known to be well formed, so only caller-supplied lists are validated
         if isinstance(content, str):
-            messages = [{"role": "user", "content": content}]
+            request_data = LakeraGuardRequest.model_construct(
+                messages=[{"role": "user", "content": content}],
+                dev_info=include_dev_info
+            )
         else:
-            messages = content
+            request_data = LakeraGuardRequest(
+                messages=content,
+                dev_info=include_dev_info
+            )
+        payload = request_data.model_dump_json(exclude_none=True)
         
-        request_data = LakeraGuardRequest(
-            messages=messages,
-            dev_info=include_dev_info
-        )
+        # The serialised request covers both the messages and the dev_info flag
+        if self._response_cache.enabled:
+            key = content_key(payload)
+            now = time.monotonic()
+            cached = self._response_cache.get(key, now)
+            if cached is not None:
+                return cached
         
         try:
             response = self.session.post(
-                urljoin(self.base_url, "/guard"),
-                json=request_data.model_dump(exclude_none=True),
+                self._guard_url,
+                data=payload,
+                headers=self.headers,
                 timeout=self.timeout
             )
             response.raise_for_status()
             
-            response_data = response.json()
-            return LakeraGuardResponse(**response_data)
+            # Validate the raw body in pydantic-core, without a dict in between
+            guard_response = LakeraGuardResponse.model_validate_json(response.content)
             
         except requests.RequestException as e:
             logger.error(f"Lakera Guard API request failed: {e}")
             raise
+        
+        if self._response_cache.enabled:
+            self._response_cache.put(key, guard_response, now)
+        return guard_response
+    
+    def screen_contents(self, contents: List[str]) -> List[LakeraGuardResponse]:
+        """
+        Screen several pieces of content with as few API requests as possible.
+        
+        All contents are first sent together as one multi-message request. If
+        that combined request is not flagged, every item is safe and a single
+        round-trip was enough; each item then gets a plain unflagged verdict,
+        since the combined scores and dev_info describe the whole batch rather
+        than any one item. Otherwise, or if the API rejects the combined
+        request, each item is screened on its own, concurrently, so the
+        verdicts can be attributed to the right content.
+        
+        Args:
+            contents: Content strings to screen
+            
+        Returns:
+            List of LakeraGuardResponse objects, one per content string
+            
+        Raises:
+            requests.RequestException: If an API request fails
+        """
+        if not contents:
+            return []
+        
+        if len(contents) > 1:
+            try:
+                combined = self.screen_content(
+                    [{"role": "user", "content": content} for content in contents]
+                )
+            except requests.RequestException as e:
+                # The API may reject a large batch; screen the items one by one instead
+                logger.warning(f"Combined screening of {len(contents)} items failed, screening individually: {e}")
+            else:
+                if not combined.flagged:
+                    # Responses are frozen, so one clean verdict can be shared
+                    clean = LakeraGuardResponse(flagged=False)
+                    return [clean] * len(contents)
+        
+        if len(contents) == 1:
+            return [self.screen_content(contents[0])]
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_SCREENING_WORKERS, len(contents))) as executor:
+            return list(executor.map(self.screen_content, contents))
     
     def screen_tool_description(self, description: str) -> LakeraGuardResponse:
         """
@@ -147,7 +248,7 @@ class LakeraClient:
         # Create a representation of the interaction for screening
         interaction_text = f"Method: {method}"
         if params:
-            interaction_text += f"\nParameters: {str(params)}"
+            interaction_text += f"\nParameters: {canonical_json(params)}"
         
         return self.screen_content(interaction_text)
     
@@ -186,9 +287,12 @@ class LakeraClient:
             logger.warning(f"Failed to get threat categories: {e}")
             return {}
     
+    def clear_cache(self):
+        """Discard all cached screening responses."""
+        self._response_cache.clear()
+    
     def close(self):
-        """Close the client session."""
-        self.session.close()
+        """Close the client; the shared connection pool stays open for other clients."""
     
     def __enter__(self):
         """Context manager entry."""
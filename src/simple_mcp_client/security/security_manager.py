@@ -5,10 +5,15 @@ This module provides a security manager that integrates Lakera Guard
 screening into the MCP client workflow.
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from .lakera_client import LakeraClient, LakeraGuardResponse
+from ..utils.helpers import canonical_json
+from ..utils.ttl_cache import TTLCache, content_key
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +32,16 @@ class SecurityManager:
     Security manager for MCP client interactions.
     
     This manager integrates Lakera Guard screening to ensure safe
-    interactions with MCP servers.
+    interactions with MCP servers. Verdicts are cached in memory by content
+    digest, so screening the same content again skips the API round trip.
+    Screening is fail-open: when the Lakera API cannot be reached, the error
+    is counted in screening_errors and the tool or interaction is treated as
+    safe, so an outage does not take the client down. Callers that need a
+    fail-closed check can use LakeraClient.is_content_safe.
+    This verdict cache owns expiry: a Lakera client created by the manager
+    has its own response cache disabled, so every hit and miss is counted in
+    the screening statistics. Tools on the trusted allow-list are accepted
+    without calling the API.
     """
     
     def __init__(
@@ -35,30 +49,149 @@ class SecurityManager:
         lakera_client: Optional[LakeraClient] = None,
         enable_tool_screening: bool = True,
         enable_interaction_screening: bool = True,
-        fail_on_violation: bool = True
+        fail_on_violation: bool = True,
+        cache_ttl: Optional[float] = 3600.0,
+        cache_maxsize: int = 10_000,
+        trusted_tool_digests: Optional[Iterable[bytes]] = None,
+        api_key: Optional[str] = None
     ):
         """
         Initialize the security manager.
         
         Args:
-            lakera_client: Lakera client instance (will create one if not provided)
+            lakera_client: Lakera client instance (will create one if not provided).
+                A provided client is left open on close() so it can be shared;
+                create it with cache_ttl=None so verdicts are cached only here.
             enable_tool_screening: Whether to screen tool descriptions
             enable_interaction_screening: Whether to screen server interactions
             fail_on_violation: Whether to raise exceptions on security violations
+            cache_ttl: Seconds to cache screening verdicts (None disables caching)
+            cache_maxsize: Maximum number of cached verdicts
+            trusted_tool_digests: SHA-256 digests (see tool_digest) of tools
+                known to be safe, which skip Lakera screening
+            api_key: Lakera API key for the client created when lakera_client
+                is not provided (defaults to LAKERA_GUARD_API_KEY env var)
         """
-        self.lakera_client = lakera_client or LakeraClient()
+        self._owns_lakera_client = lakera_client is None
+        self.lakera_client = lakera_client or LakeraClient(api_key=api_key, cache_ttl=None)
         self.enable_tool_screening = enable_tool_screening
         self.enable_interaction_screening = enable_interaction_screening
         self.fail_on_violation = fail_on_violation
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self.trusted_tool_digests = frozenset(trusted_tool_digests or ())
+        
+        # Screening may run on several threads at once
+        self._stats_lock = threading.Lock()
+        
+        # LRU cache of verdicts keyed by content digest
+        self._verdict_cache = TTLCache(cache_maxsize, cache_ttl)
         
         # Track screening statistics
         self.screening_stats = {
             "tools_screened": 0,
             "interactions_screened": 0,
             "violations_detected": 0,
-            "screening_errors": 0
+            "screening_errors": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "tools_trusted": 0,
+            "skipped_empty": 0
         }
     
+    def _count(self, stat: str):
+        """Increment a screening statistic."""
+        with self._stats_lock:
+            self.screening_stats[stat] += 1
+    
+    def _cache_enabled(self) -> bool:
+        """Whether screening verdicts are cached."""
+        return self._verdict_cache.enabled
+    
+    def _cache_get(self, content: str, now: float) -> Optional[LakeraGuardResponse]:
+        """Return the unexpired cached verdict for content, or None."""
+        response = self._verdict_cache.get(content_key(content), now)
+        self._count("cache_hits" if response is not None else "cache_misses")
+        return response
+    
+    def _cache_put(self, content: str, now: float, response: LakeraGuardResponse):
+        """Cache the verdict for content, evicting the least recently used entries."""
+        self._verdict_cache.put(content_key(content), response, now)
+    
+    def _cached_screen(
+        self,
+        content: str,
+        screen: Callable[[], LakeraGuardResponse]
+    ) -> LakeraGuardResponse:
+        """
+        Return the cached verdict for content, screening it on a miss.
+        
+        Args:
+            content: Text identifying what is being screened
+            screen: Callable performing the actual screening
+            
+        Returns:
+            LakeraGuardResponse for the content
+        """
+        if not self._cache_enabled():
+            return screen()
+        
+        now = time.monotonic()
+        response = self._cache_get(content, now)
+        if response is None:
+            response = screen()
+            self._cache_put(content, now, response)
+        
+        return response
+    
+    def clear_cache(self):
+        """Discard all cached screening verdicts."""
+        self._verdict_cache.clear()
+    
+    @staticmethod
+    def _tool_content(
+        tool_name: str,
+        tool_description: str,
+        tool_parameters: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Create a comprehensive tool representation for screening."""
+        tool_content = f"Tool: {tool_name}\nDescription: {tool_description}"
+        if tool_parameters:
+            tool_content += f"\nParameters: {str(tool_parameters)}"
+        return tool_content
+    
+    @classmethod
+    def tool_digest(
+        cls,
+        tool_name: str,
+        tool_description: str,
+        tool_parameters: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """
+        Compute the allow-list digest of a tool.
+        
+        Args:
+            tool_name: Name of the tool
+            tool_description: Description of the tool
+            tool_parameters: Tool parameters schema
+            
+        Returns:
+            SHA-256 digest of the tool as it would be screened
+        """
+        return hashlib.sha256(
+            cls._tool_content(tool_name, tool_description, tool_parameters).encode()
+        ).digest()
+    
+    def _is_trusted(self, tool_content: str) -> bool:
+        """Whether the tool is on the allow-list, counting allow-list hits."""
+        if not self.trusted_tool_digests:
+            return False
+        
+        if hashlib.sha256(tool_content.encode()).digest() in self.trusted_tool_digests:
+            self._count("tools_trusted")
+            return True
+        return False
+    
     def screen_tool_registration(
         self,
         tool_name: str,
@@ -83,16 +216,18 @@ class SecurityManager:
             return True
         
         try:
-            # Create comprehensive tool representation for screening
-            tool_content = f"Tool: {tool_name}\nDescription: {tool_description}"
-            if tool_parameters:
-                tool_content += f"\nParameters: {str(tool_parameters)}"
+            tool_content = self._tool_content(tool_name, tool_description, tool_parameters)
+            if self._is_trusted(tool_content):
+                return True
             
-            response = self.lakera_client.screen_tool_description(tool_content)
-            self.screening_stats["tools_screened"] += 1
+            response = self._cached_screen(
+                tool_content,
+                lambda: self.lakera_client.screen_tool_description(tool_content)
+            )
+            self._count("tools_screened")
             
             if response.flagged:
-                self.screening_stats["violations_detected"] += 1
+                self._count("violations_detected")
                 violation_msg = f"Tool '{tool_name}' flagged by security screening"
                 
                 if self.fail_on_violation:
@@ -108,7 +243,7 @@ class SecurityManager:
             return True
             
         except Exception as e:
-            self.screening_stats["screening_errors"] += 1
+            self._count("screening_errors")
             if isinstance(e, SecurityViolation):
                 raise
             else:
@@ -116,11 +251,97 @@ class SecurityManager:
                 # Default to safe if screening fails
                 return True
     
+    def screen_tool_registrations(self, tools: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Screen several tools during registration with a single batched request.
+        
+        Trusted and cached verdicts are reused, and all remaining tools are screened
+        together via LakeraClient.screen_contents. Unlike
+        screen_tool_registration, flagged tools are reported as False rather
+        than raising, so one unsafe tool does not hide the other verdicts.
+        
+        Args:
+            tools: Tools to screen, each with "name", "description" and
+                optional "parameters" keys
+            
+        Returns:
+            Dictionary mapping each tool name to True if safe, False if flagged
+        """
+        results: Dict[str, bool] = {}
+        for tool, safe in zip(tools, self._screen_tools_batch(tools)):
+            name = tool.get("name", "Unknown")
+            results[name] = results.get(name, True) and safe
+        
+        return results
+    
+    def _screen_tools_batch(self, tools: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Screen tools with one batched request, returning a verdict per tool.
+        
+        If the screening request fails, the error is counted and the affected
+        tools are reported as safe, following the manager's fail-open policy.
+        """
+        if not self.enable_tool_screening:
+            return [True] * len(tools)
+        
+        names = [tool.get("name", "Unknown") for tool in tools]
+        contents = [
+            self._tool_content(name, tool.get("description", ""), tool.get("parameters"))
+            for name, tool in zip(names, tools)
+        ]
+        
+        trusted = [self._is_trusted(content) for content in contents]
+        
+        use_cache = self._cache_enabled()
+        now = time.monotonic()
+        responses: List[Optional[LakeraGuardResponse]] = [
+            self._cache_get(content, now) if use_cache and not is_trusted else None
+            for content, is_trusted in zip(contents, trusted)
+        ]
+        
+        # Tools with identical content are screened once and share the verdict
+        pending: Dict[str, List[int]] = {}
+        for i, response in enumerate(responses):
+            if response is None and not trusted[i]:
+                pending.setdefault(contents[i], []).append(i)
+        
+        if pending:
+            screened: List[Optional[LakeraGuardResponse]]
+            try:
+                screened = list(self.lakera_client.screen_contents(list(pending)))
+            except Exception as e:
+                self._count("screening_errors")
+                logger.error(f"Error screening {len(pending)} tools: {e}")
+                # No verdicts; these tools fail open below
+                screened = [None] * len(pending)
+            
+            for (content, indices), response in zip(pending.items(), screened):
+                for i in indices:
+                    responses[i] = response
+                if use_cache and response is not None:
+                    self._cache_put(content, now, response)
+        
+        verdicts = []
+        for name, response in zip(names, responses):
+            if response is None:
+                # Trusted, or screening failed: fail open like screen_tool_registration
+                verdicts.append(True)
+                continue
+            
+            self._count("tools_screened")
+            if response.flagged:
+                self._count("violations_detected")
+                logger.warning(f"Tool '{name}' flagged by security screening. Categories: {response.categories}")
+            verdicts.append(not response.flagged)
+        
+        return verdicts
+    
     def screen_server_interaction(
         self,
         method: str,
         params: Optional[Dict[str, Any]] = None,
-        response_data: Optional[Dict[str, Any]] = None
+        response_data: Optional[Dict[str, Any]] = None,
+        screen_request: bool = True
     ) -> bool:
         """
         Screen a server interaction.
@@ -129,6 +350,8 @@ class SecurityManager:
             method: MCP method being called
             params: Parameters being sent to the server
             response_data: Response data from the server
+            screen_request: Whether to screen the request as well; pass False
+                when the request was already screened before it was sent
             
         Returns:
             True if interaction is safe, False if flagged
@@ -139,24 +362,38 @@ class SecurityManager:
         if not self.enable_interaction_screening:
             return True
         
+        # A bare method name with no parameters or response carries nothing to screen
+        if not params and not response_data:
+            self._count("skipped_empty")
+            return True
+        
         try:
             # Screen the request
-            request_response = self.lakera_client.screen_server_interaction(method, params)
+            request_response = None
+            if screen_request and params:
+                request_text = f"Method: {method}\nParameters: {canonical_json(params)}"
+                request_response = self._cached_screen(
+                    request_text,
+                    lambda: self.lakera_client.screen_server_interaction(method, params)
+                )
             
             # Screen the response if provided
             response_response = None
             if response_data:
-                response_text = f"Response for {method}: {str(response_data)}"
-                response_response = self.lakera_client.screen_content(response_text)
+                response_text = f"Response for {method}: {canonical_json(response_data)}"
+                response_response = self._cached_screen(
+                    response_text,
+                    lambda: self.lakera_client.screen_content(response_text)
+                )
             
-            self.screening_stats["interactions_screened"] += 1
+            self._count("interactions_screened")
             
             # Check for violations
-            request_flagged = request_response.flagged
+            request_flagged = request_response.flagged if request_response else False
             response_flagged = response_response.flagged if response_response else False
             
             if request_flagged or response_flagged:
-                self.screening_stats["violations_detected"] += 1
+                self._count("violations_detected")
                 violation_msg = f"Server interaction flagged by security screening"
                 
                 if request_flagged:
@@ -165,11 +402,12 @@ class SecurityManager:
                     violation_msg += f" (response: {response_response.categories})"
                 
                 if self.fail_on_violation:
-                    # Use request response for exception details
+                    # Prefer the request verdict for exception details
+                    flagged_response = request_response if request_flagged else response_response
                     raise SecurityViolation(
                         violation_msg,
-                        request_response.categories,
-                        request_response.category_scores
+                        flagged_response.categories,
+                        flagged_response.category_scores
                     )
                 else:
                     logger.warning(violation_msg)
@@ -178,7 +416,7 @@ class SecurityManager:
             return True
             
         except Exception as e:
-            self.screening_stats["screening_errors"] += 1
+            self._count("screening_errors")
             if isinstance(e, SecurityViolation):
                 raise
             else:
@@ -190,6 +428,9 @@ class SecurityManager:
         """
         Screen a list of tools and filter out unsafe ones.
         
+        Uncached tools are screened together in one batched request, so the
+        list usually costs a single round trip.
+        
         Args:
             tools: List of tools to screen
             
@@ -200,20 +441,11 @@ class SecurityManager:
             return tools
         
         safe_tools = []
-        
-        for tool in tools:
-            tool_name = tool.get("name", "Unknown")
-            tool_description = tool.get("description", "")
-            tool_parameters = tool.get("parameters")
-            
-            try:
-                if self.screen_tool_registration(tool_name, tool_description, tool_parameters):
-                    safe_tools.append(tool)
-                else:
-                    logger.info(f"Tool '{tool_name}' filtered out due to security concerns")
-            except SecurityViolation:
-                logger.info(f"Tool '{tool_name}' filtered out due to security violation")
-                # Continue processing other tools
+        for tool, safe in zip(tools, self._screen_tools_batch(tools)):
+            if safe:
+                safe_tools.append(tool)
+            else:
+                logger.info(f"Tool '{tool.get('name', 'Unknown')}' filtered out due to security concerns")
         
         return safe_tools
     
@@ -232,12 +464,16 @@ class SecurityManager:
             "tools_screened": 0,
             "interactions_screened": 0,
             "violations_detected": 0,
-            "screening_errors": 0
+            "screening_errors": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "tools_trusted": 0,
+            "skipped_empty": 0
         }
     
     def close(self):
-        """Close the security manager and underlying Lakera client."""
-        if self.lakera_client:
+        """Close the security manager and the Lakera client it created."""
+        if self.lakera_client and self._owns_lakera_client:
             self.lakera_client.close()
     
     def __enter__(self):
@@ -4,6 +4,6 @@ Utility functions for the Simple MCP Client.
 This module contains helper functions and utilities used throughout the package.
 """
 
-from .helpers import format_request, parse_response
+from .helpers import format_request, format_request_bytes, parse_response
 
-__all__ = ["format_request", "parse_response"] 
\ No newline at end of file
+__all__ = ["format_request", "format_request_bytes", "parse_response"] 
\ No newline at end of file
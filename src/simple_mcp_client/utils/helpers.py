@@ -5,7 +5,16 @@ This module provides utility functions for formatting requests and parsing respo
 """
 
 import json
-from typing import Any, Dict, Optional
+import re
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from .json_fast import JSONDecodeError, dumps as json_dumps, loads as json_loads
+
+if TYPE_CHECKING:
+    import requests
+
+# Scheme, a host that does not start with a separator, and no whitespace
+_URL_RE = re.compile(r"^https?://[^\s/$.?#][^\s]*$")
 
 
 def format_request(method: str, params: Optional[Dict[str, Any]] = None, request_id: str = "1") -> Dict[str, Any]:
@@ -20,16 +29,29 @@ def format_request(method: str, params: Optional[Dict[str, Any]] = None, request
     Returns:
         Formatted request dictionary
     """
-    request = {
-        "jsonrpc": "2.0",
-        "method": method,
-        "id": request_id
-    }
+    # Built as a single literal in either case, with a fixed key order
+    if not params:
+        return {"jsonrpc": "2.0", "method": method, "id": request_id}
+    
+    return {"jsonrpc": "2.0", "method": method, "id": request_id, "params": params}
+
+
+def format_request_bytes(method: str, params: Optional[Dict[str, Any]] = None, request_id: str = "1") -> bytes:
+    """
+    Format a request for the MCP server as UTF-8 encoded JSON.
+    
+    The body is serialised with orjson when it is installed, ready to be
+    sent as the request data without encoding it again.
     
-    if params:
-        request["params"] = params
+    Args:
+        method: The MCP method to call
+        params: Optional parameters for the request
+        request_id: Unique identifier for the request
         
-    return request
+    Returns:
+        Request body as JSON bytes
+    """
+    return json_dumps(format_request(method, params, request_id))
 
 
 def parse_response(response_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -45,14 +67,19 @@ def parse_response(response_data: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValueError: If the response format is invalid
     """
-    if "jsonrpc" not in response_data or response_data["jsonrpc"] != "2.0":
+    try:
+        version = response_data["jsonrpc"]
+    except (KeyError, TypeError):
+        raise ValueError("Invalid JSON-RPC response format") from None
+    if version != "2.0":
         raise ValueError("Invalid JSON-RPC response format")
     
-    if "error" in response_data:
+    # Successful responses carry no error, so look the error up only once
+    try:
         error = response_data["error"]
-        raise ValueError(f"MCP Error {error.get('code', 'unknown')}: {error.get('message', 'Unknown error')}")
-    
-    return response_data.get("result", {})
+    except KeyError:
+        return response_data.get("result", {})
+    raise ValueError(f"MCP Error {error.get('code', 'unknown')}: {error.get('message', 'Unknown error')}")
 
 
 def validate_url(url: str) -> bool:
@@ -65,27 +92,83 @@ def validate_url(url: str) -> bool:
     Returns:
         True if URL is valid, False otherwise
     """
-    if not url:
+    # The prefix check rejects most bad input without running the regex
+    if not url or not url.startswith(('http://', 'https://')):
         return False
     
-    # Basic URL validation
-    if not (url.startswith('http://') or url.startswith('https://')):
-        return False
+    return _URL_RE.match(url) is not None
+
+
+def canonical_json(obj: Any) -> str:
+    """
+    Serialise an object to compact JSON with sorted keys.
+    
+    Equal data always gives the same text regardless of key order, which
+    keeps screening payloads small and their cache keys stable.
     
-    return True
+    Args:
+        obj: Object to serialise; unsupported values are converted with str()
+        
+    Returns:
+        Canonical JSON text, or str(obj) if the keys cannot be sorted
+    """
+    try:
+        return json.dumps(obj, separators=(",", ":"), sort_keys=True, ensure_ascii=False, default=str)
+    except TypeError:
+        # Mixed key types cannot be sorted
+        return str(obj)
 
 
-def safe_json_loads(data: str) -> Optional[Dict[str, Any]]:
+def safe_json_loads(data: Union[str, bytes]) -> Optional[Dict[str, Any]]:
     """
     Safely parse JSON data.
     
+    Uses orjson when it is installed, so bytes are parsed without decoding
+    them to text first.
+    
     Args:
-        data: JSON string to parse
+        data: JSON text or UTF-8 encoded bytes to parse
         
     Returns:
         Parsed dictionary or None if parsing fails
     """
     try:
-        return json.loads(data)
-    except (json.JSONDecodeError, TypeError):
-        return None 
\ No newline at end of file
+        return json_loads(data)
+    except (JSONDecodeError, TypeError):
+        return None 
+
+
+def create_session(
+    headers: Optional[Dict[str, str]] = None,
+    pool_maxsize: int = 32,
+    max_retries: int = 3,
+    pool_connections: int = 10
+) -> "requests.Session":
+    """
+    Create an HTTP session with a pooled keep-alive adapter.
+    
+    Args:
+        headers: Default headers to send with every request
+        pool_maxsize: Maximum number of connections kept per host
+        max_retries: Number of retries for failed connections (0 disables retries)
+        pool_connections: Number of per-host connection pools kept
+        
+    Returns:
+        Configured requests.Session
+    """
+    # Imported here so the URL and formatting helpers stay cheap to import
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=max_retries, backoff_factor=0.1) if max_retries else 0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
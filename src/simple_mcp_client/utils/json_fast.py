@@ -0,0 +1,65 @@
+"""
+Fast JSON serialisation helpers.
+
+This module uses the optional ``orjson`` extension when it is installed and
+falls back to the standard library ``json`` module otherwise.
+"""
+
+import json
+from types import ModuleType
+from typing import Any, Callable, Optional, Union
+
+# Declared Optional so type checkers keep the standard library fallback reachable
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialise an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: Object to serialise
+        indent: Whether to pretty-print with two-space indentation
+        default: Function returning a serialisable version of unsupported objects
+        
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        encoded: bytes = orjson.dumps(obj, default=default, option=option)
+        return encoded
+    
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=default
+    ).encode()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+        
+    Returns:
+        The parsed object
+        
+    Raises:
+        JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
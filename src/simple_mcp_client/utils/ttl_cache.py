@@ -0,0 +1,100 @@
+"""
+Small thread-safe LRU cache with per-entry expiry.
+
+This module provides the in-memory cache used to remember Lakera Guard
+verdicts, keyed by a digest of the screened content.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+def content_key(content: str) -> bytes:
+    """
+    Build a compact cache key for a piece of content.
+
+    Args:
+        content: Content string to key
+
+    Returns:
+        16-byte BLAKE2b digest of the content
+    """
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+class TTLCache:
+    """
+    Least recently used cache whose entries expire after a fixed TTL.
+
+    The current time is passed in by the caller, so one clock reading can be
+    shared between a lookup and the store that follows a miss.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float]):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid (None or 0 disables the cache)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are stored at all."""
+        return bool(self.ttl) and self.maxsize > 0
+
+    def get(self, key: Hashable, now: float) -> Optional[Any]:
+        """
+        Get an unexpired value.
+
+        Args:
+            key: Cache key
+            now: Current monotonic time
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, now: float):
+        """
+        Store a value, evicting the least recently used entries when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            now: Current monotonic time
+        """
+        if not self.enabled:
+            return
+
+        assert self.ttl is not None  # enabled implies a TTL
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Discard all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet evicted."""
+        return len(self._entries)
@@ -0,0 +1,104 @@
+"""
+Tests for the AsyncMCPClient class.
+
+This module contains unit tests for the asyncio client against a local test server.
+"""
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer as AiohttpTestServer
+
+from simple_mcp_client.core.async_client import AsyncMCPClient
+from simple_mcp_client.core.client import MCPResponse
+
+
+def make_app(requests_seen):
+    """Build a minimal MCP server application that records incoming requests."""
+    async def health(request):
+        return web.Response(text="ok")
+
+    async def rpc(request):
+        data = await request.json()
+        requests_seen.append(data)
+        if data["method"] == "tools/list":
+            result = {"tools": [{"name": "search_google"}]}
+        else:
+            result = {"content": f"result for {data['params']['name']}"}
+        return web.json_response({"jsonrpc": "2.0", "result": result, "id": data["id"]})
+
+    app = web.Application()
+    app.router.add_get("/health", health)
+    app.router.add_post("/", rpc)
+    return app
+
+
+def run_with_client(scenario):
+    """Run ``scenario(client, requests_seen)`` against a local test server."""
+    async def runner():
+        requests_seen = []
+        async with AiohttpTestServer(make_app(requests_seen)) as server:
+            url = str(server.make_url("/"))
+            async with AsyncMCPClient(url, enable_security=False) as client:
+                return await scenario(client, requests_seen)
+
+    return asyncio.run(runner())
+
+
+class TestAsyncMCPClient:
+    """Test cases for AsyncMCPClient class."""
+
+    def test_client_initialization(self):
+        """Test AsyncMCPClient initialization."""
+        client = AsyncMCPClient("http://localhost:8000/", enable_security=False)
+        assert client.server_url == "http://localhost:8000"
+        assert client.timeout == 30
+        assert client.security_manager is None
+
+    def test_connect(self):
+        """Test connecting to a running server."""
+        async def scenario(client, requests_seen):
+            return await client.connect()
+
+        assert run_with_client(scenario) is True
+
+    def test_connect_uses_root_health_url(self):
+        """Test the health check targets the server root, not the endpoint path."""
+        client = AsyncMCPClient("http://localhost:8000/mcp", enable_security=False)
+        assert client._health_url == "http://localhost:8000/health"
+
+    def test_connect_failure(self):
+        """Test connecting to an unreachable server."""
+        async def scenario():
+            async with AsyncMCPClient("http://127.0.0.1:9", enable_security=False) as client:
+                return await client.connect()
+
+        assert asyncio.run(scenario()) is False
+
+    def test_list_tools(self):
+        """Test listing tools."""
+        async def scenario(client, requests_seen):
+            return await client.list_tools()
+
+        response = run_with_client(scenario)
+        assert isinstance(response, MCPResponse)
+        assert response.result == {"tools": [{"name": "search_google"}]}
+
+    def test_concurrent_call_tool(self):
+        """Test several tool calls gathered concurrently."""
+        async def scenario(client, requests_seen):
+            responses = await asyncio.gather(
+                client.call_tool("search_google", {"query": "mcp"}),
+                client.call_tool("search_youtube", {"query": "mcp"}),
+            )
+            return responses, requests_seen
+
+        responses, requests_seen = run_with_client(scenario)
+        assert [r.result["content"] for r in responses] == [
+            "result for search_google",
+            "result for search_youtube",
+        ]
+        assert all(r["method"] == "tools/call" for r in requests_seen)
@@ -0,0 +1,248 @@
+"""
+Tests for the command-line interface.
+
+This module contains unit tests for the CLI commands and their helpers.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from simple_mcp_client.cli.main import main, setup_security
+from simple_mcp_client.config import add_server_configs, get_server_config
+from simple_mcp_client.core.client import MCPResponse
+from simple_mcp_client.security import get_security_manager
+
+
+@pytest.fixture(autouse=True)
+def clear_security_manager():
+    """Give every test a fresh shared security manager."""
+    get_security_manager.cache_clear()
+    yield
+    get_security_manager.cache_clear()
+
+
+def test_help_skips_heavy_imports():
+    """Test --help builds the command tree without loading pydantic or requests."""
+    code = (
+        "import sys\n"
+        "from simple_mcp_client.cli.main import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in ('pydantic', 'requests') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert "Simple MCP Client" in result.stdout
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
+class TestSetupSecurity:
+    """Test cases for the setup_security helper."""
+
+    def test_disabled(self, capsys):
+        """Test disabling security skips creating a manager."""
+        assert setup_security(True, None) == (None, False)
+        assert "Security screening disabled" in capsys.readouterr().out
+
+    def test_enabled_with_key(self, capsys):
+        """Test an explicit key enables screening with the shared manager."""
+        security_manager, enabled = setup_security(False, "test-key")
+
+        assert enabled is True
+        assert security_manager.lakera_client.api_key == "test-key"
+        assert setup_security(False, "test-key")[0] is security_manager
+        assert "Security screening enabled" in capsys.readouterr().out
+
+    def test_missing_key(self, capsys):
+        """Test a missing key falls back to running without security."""
+        with patch.dict('os.environ', {}, clear=True):
+            assert setup_security(False, None) == (None, False)
+        assert "Security disabled" in capsys.readouterr().err
+
+
+class TestServerCommands:
+    """Test cases for the single server commands."""
+
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_connect_without_security(self, mock_connect):
+        """Test connecting with security disabled."""
+        result = CliRunner().invoke(main, [
+            'server', 'connect', '--server-url', 'http://localhost:8000', '--disable-security'
+        ])
+
+        assert result.exit_code == 0
+        assert "Security screening disabled" in result.output
+        assert "Successfully connected to http://localhost:8000" in result.output
+
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_connect_with_api_key(self, mock_connect):
+        """Test the API key option enables security screening."""
+        result = CliRunner().invoke(main, [
+            'server', 'connect', '--server-url', 'http://localhost:8000', '--lakera-api-key', 'test-key'
+        ])
+
+        assert result.exit_code == 0
+        assert "Security screening enabled" in result.output
+
+    def test_connect_invalid_url(self):
+        """Test connecting to an invalid URL fails."""
+        result = CliRunner().invoke(main, ['server', 'connect', '--server-url', 'not-a-url', '--disable-security'])
+
+        assert result.exit_code == 1
+        assert "Invalid URL format" in result.output
+
+    def test_call_tool_invalid_arguments(self):
+        """Test malformed JSON arguments are rejected before connecting."""
+        result = CliRunner().invoke(main, [
+            'server', 'call-tool', '--server-url', 'http://localhost:8000',
+            '--tool-name', 'calculator', '--arguments', '{not json', '--disable-security'
+        ])
+
+        assert result.exit_code == 1
+        assert "Invalid JSON format for arguments" in result.output
+
+    @patch('simple_mcp_client.core.client.MCPClient.call_tool')
+    def test_call_tool_stdout(self, mock_call_tool):
+        """Test the tool result is written to stdout by default."""
+        mock_call_tool.return_value = MCPResponse(result={"sum": 6})
+        result = CliRunner().invoke(main, [
+            'server', 'call-tool', '--server-url', 'http://localhost:8000',
+            '--tool-name', 'calculator', '--disable-security'
+        ])
+
+        assert result.exit_code == 0
+        assert '"sum": 6' in result.output
+        assert "saved to" not in result.output
+
+    @patch('simple_mcp_client.core.client.MCPClient.call_tool')
+    def test_call_tool_output_file(self, mock_call_tool, tmp_path):
+        """Test the tool result is saved to the output file."""
+        mock_call_tool.return_value = MCPResponse(result={"sum": 6})
+        output = tmp_path / "result.json"
+        result = CliRunner().invoke(main, [
+            'server', 'call-tool', '--server-url', 'http://localhost:8000',
+            '--tool-name', 'calculator', '--output', str(output), '--disable-security'
+        ])
+
+        assert result.exit_code == 0
+        assert f"Tool result saved to {output}" in result.output
+        assert json.loads(output.read_text()) == {"sum": 6}
+
+    def test_output_file_not_created_on_error(self, tmp_path):
+        """Test a failing command does not leave an empty output file behind."""
+        output = tmp_path / "result.json"
+        result = CliRunner().invoke(main, [
+            'server', 'call-tool', '--server-url', 'http://localhost:8000',
+            '--tool-name', 'calculator', '--arguments', '{not json',
+            '--output', str(output), '--disable-security'
+        ])
+
+        assert result.exit_code == 1
+        assert not output.exists()
+
+
+class TestScreenCommand:
+    """Test cases for the screen command."""
+
+    @patch('requests.Session.post')
+    def test_screen_with_api_key(self, mock_post):
+        """Test the API key option is passed on without touching the environment."""
+        mock_post.return_value.content = json.dumps({"flagged": False}).encode()
+
+        with patch.dict('os.environ', {}, clear=True):
+            result = CliRunner().invoke(main, ['screen', '--content', 'hello', '--lakera-api-key', 'test-key'])
+            assert 'LAKERA_GUARD_API_KEY' not in os.environ
+
+        assert result.exit_code == 0
+        assert "Content appears safe" in result.output
+
+
+class TestMultiCommands:
+    """Test cases for the multi-server commands."""
+
+    def test_add_server_tags(self, tmp_path):
+        """Test comma-separated tags are split and blank entries dropped."""
+        config_path = tmp_path / "config.json"
+
+        with patch('simple_mcp_client.config.server_config.get_config_path', return_value=config_path):
+            result = CliRunner().invoke(main, [
+                'multi', 'add-server', '--name', 'math', '--url', 'http://localhost:8001',
+                '--tags', ' math , ,machine learning,'
+            ])
+
+        assert result.exit_code == 0
+        assert get_server_config("math", config_path).tags == ["math", "machine learning"]
+
+    def test_list_servers(self, tmp_path):
+        """Test configured servers are listed with their details."""
+        config_path = tmp_path / "config.json"
+        add_server_configs([
+            {"name": "math", "url": "http://localhost:8001", "tags": ["math"]},
+            {"name": "files", "url": "http://localhost:8002", "enabled": False},
+        ], config_path)
+
+        with patch('simple_mcp_client.config.server_config.get_config_path', return_value=config_path):
+            result = CliRunner().invoke(main, ['multi', 'list-servers'])
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "Configured servers (2):",
+            "  - math (http://localhost:8001) [✅ Enabled]",
+            "    Tags: math",
+            "    Priority: 0, Timeout: 30s",
+            "  - files (http://localhost:8002) [❌ Disabled]",
+            "    Priority: 0, Timeout: 30s",
+        ]
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_list_all_tools_output_file(self, mock_connect, mock_list_tools, tmp_path):
+        """Test the tools of every server are saved as JSON."""
+        config_path = tmp_path / "config.json"
+        add_server_configs([{"name": "math", "url": "http://localhost:8001"}], config_path)
+        mock_list_tools.return_value = MCPResponse(result={"tools": [
+            {"name": "calculator", "description": "Basic arithmetic", "parameters": {"a": "int"}}
+        ]})
+        output = tmp_path / "tools.json"
+
+        with patch('simple_mcp_client.config.server_config.get_config_path', return_value=config_path):
+            result = CliRunner().invoke(main, [
+                'multi', 'list-all-tools', '--output', str(output), '--disable-security'
+            ])
+
+        assert result.exit_code == 0
+        assert json.loads(output.read_text()) == [{
+            "name": "calculator",
+            "description": "Basic arithmetic",
+            "server": "http://localhost:8001",
+            "parameters": {"a": "int"}
+        }]
+
+    @pytest.mark.parametrize("mode, announced", [("first", True), ("race", False)])
+    @patch('simple_mcp_client.core.client.MCPClient.call_tool')
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_call_tool_multi_announces_server(self, mock_connect, mock_list_tools, mock_call_tool,
+                                              mode, announced, tmp_path):
+        """Test the chosen server is only reported when one server is called."""
+        config_path = tmp_path / "config.json"
+        add_server_configs([{"name": "math", "url": "http://localhost:8001"}], config_path)
+        mock_list_tools.return_value = MCPResponse(result={"tools": [{"name": "calculator"}]})
+        mock_call_tool.return_value = MCPResponse(result={"sum": 3})
+
+        with patch('simple_mcp_client.config.server_config.get_config_path', return_value=config_path):
+            result = CliRunner().invoke(main, [
+                'multi', 'call-tool-multi', '--tool-name', 'calculator',
+                '--mode', mode, '--disable-security'
+            ])
+
+        assert result.exit_code == 0
+        assert ("Found tool 'calculator'" in result.output) is announced
@@ -5,6 +5,8 @@ This module contains unit tests for the main client functionality.
 """
 
 import json
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,6 +15,18 @@ import requests
 from simple_mcp_client.core.client import MCPClient, MCPRequest, MCPResponse
 
 
+def test_sync_client_skips_async_imports():
+    """Test importing the sync client does not load the async client or aiohttp."""
+    code = (
+        "import sys\n"
+        "from simple_mcp_client.core.client import MCPClient\n"
+        "print(sorted(m for m in ('aiohttp', 'simple_mcp_client.core.async_client') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    
+    assert result.stdout.splitlines()[-1] == "[]"
+
+
 class TestMCPRequest:
     """Test cases for MCPRequest model."""
     
@@ -67,6 +81,16 @@ class TestMCPClient:
         client = MCPClient("http://localhost:8000", timeout=60)
         assert client.timeout == 60
     
+    def test_client_with_shared_session(self):
+        """Test MCPClient reuses a provided session without closing it."""
+        session = requests.Session()
+        client = MCPClient("http://localhost:8000", enable_security=False, http_session=session)
+        assert client.session is session
+        
+        with patch.object(session, 'close') as mock_close:
+            client.close()
+            mock_close.assert_not_called()
+    
     def test_client_url_normalization(self):
         """Test that URLs are properly normalized."""
         client = MCPClient("http://localhost:8000/")
@@ -83,6 +107,18 @@ class TestMCPClient:
         assert client.connect() is True
         mock_get.assert_called_once()
     
+    @patch('requests.Session.get')
+    def test_connect_uses_root_health_url(self, mock_get):
+        """Test the health check targets the server root, not the endpoint path."""
+        mock_get.return_value = Mock(status_code=200)
+        
+        client = MCPClient("http://localhost:8000/mcp", enable_security=False)
+        client.connect()
+        client.connect()
+        
+        assert mock_get.call_args[0][0] == "http://localhost:8000/health"
+        assert mock_get.call_count == 2
+    
     @patch('requests.Session.get')
     def test_connect_failure(self, mock_get):
         """Test failed connection to MCP server."""
@@ -95,11 +131,11 @@ class TestMCPClient:
     def test_send_request_success(self, mock_post):
         """Test successful request sending."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "result": {"tools": ["tool1", "tool2"]},
             "id": "1"
-        }
+        }).encode()
         mock_post.return_value = mock_response
         
         client = MCPClient("http://localhost:8000")
@@ -114,7 +150,7 @@ class TestMCPClient:
         call_args = mock_post.call_args
         assert call_args[0][0] == "http://localhost:8000"
         
-        request_data = json.loads(call_args[1]['json'])
+        request_data = json.loads(call_args[1]['data'])
         assert request_data["method"] == "tools/list"
         assert request_data["params"] == {}
     
@@ -122,11 +158,11 @@ class TestMCPClient:
     def test_send_request_with_params(self, mock_post):
         """Test request sending with parameters."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "result": {"success": True},
             "id": "1"
-        }
+        }).encode()
         mock_post.return_value = mock_response
         
         client = MCPClient("http://localhost:8000")
@@ -137,7 +173,7 @@ class TestMCPClient:
         
         # Verify parameters were sent correctly
         call_args = mock_post.call_args
-        request_data = json.loads(call_args[1]['json'])
+        request_data = json.loads(call_args[1]['data'])
         assert request_data["params"] == params
     
     @patch('requests.Session.post')
@@ -153,11 +189,11 @@ class TestMCPClient:
     def test_list_tools(self, mock_post):
         """Test list_tools method."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "result": {"tools": [{"name": "tool1"}, {"name": "tool2"}]},
             "id": "1"
-        }
+        }).encode()
         mock_post.return_value = mock_response
         
         client = MCPClient("http://localhost:8000")
@@ -167,18 +203,68 @@ class TestMCPClient:
         
         # Verify the correct method was called
         call_args = mock_post.call_args
-        request_data = json.loads(call_args[1]['json'])
+        request_data = json.loads(call_args[1]['data'])
         assert request_data["method"] == "tools/list"
     
+    @patch('simple_mcp_client.core.client.MCPClient.send_request')
+    def test_list_tools_cache(self, mock_send_request):
+        """Test list_tools reuses a cached response within the TTL."""
+        mock_send_request.return_value = MCPResponse(result={"tools": [{"name": "tool1"}]})
+        
+        client = MCPClient("http://localhost:8000", enable_security=False, tools_cache_ttl=60)
+        first = client.list_tools()
+        second = client.list_tools()
+        
+        assert first is second
+        mock_send_request.assert_called_once_with("tools/list")
+        
+        client.invalidate_tools_cache()
+        client.list_tools()
+        assert mock_send_request.call_count == 2
+    
+    @patch('simple_mcp_client.core.client.MCPClient.send_request')
+    def test_list_tools_cache_expired(self, mock_send_request):
+        """Test list_tools refetches once the cached response expires."""
+        mock_send_request.return_value = MCPResponse(result={"tools": []})
+        
+        client = MCPClient("http://localhost:8000", enable_security=False, tools_cache_ttl=60)
+        with patch('simple_mcp_client.core.client.time.monotonic', side_effect=[0, 120, 120]):
+            client.list_tools()
+            client.list_tools()
+        
+        assert mock_send_request.call_count == 2
+    
+    @patch('simple_mcp_client.core.client.MCPClient.send_request')
+    def test_list_tools_logs_new_screenings(self, mock_send_request, caplog):
+        """Test list_tools logs only the screening done since the last listing."""
+        mock_send_request.side_effect = lambda method: MCPResponse(result={"tools": [{"name": "tool1"}]})
+        security_manager = Mock()
+        security_manager.screening_stats = {"tools_screened": 0, "violations_detected": 0}
+        
+        def screen_tools_list(tools):
+            security_manager.screening_stats["tools_screened"] += len(tools)
+            return tools
+        
+        security_manager.screen_tools_list.side_effect = screen_tools_list
+        client = MCPClient("http://localhost:8000", security_manager=security_manager)
+        
+        with caplog.at_level("INFO", logger="simple_mcp_client.core.client"):
+            client.list_tools()
+            security_manager.screen_tools_list.side_effect = lambda tools: tools
+            client.list_tools()
+        
+        messages = [r.getMessage() for r in caplog.records if "Security screening" in r.getMessage()]
+        assert messages == ["Security screening: 1 tools screened, 0 violations detected"]
+    
     @patch('requests.Session.post')
     def test_call_tool(self, mock_post):
         """Test call_tool method."""
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "jsonrpc": "2.0",
             "result": {"output": "tool result"},
             "id": "1"
-        }
+        }).encode()
         mock_post.return_value = mock_response
         
         client = MCPClient("http://localhost:8000")
@@ -189,7 +275,7 @@ class TestMCPClient:
         
         # Verify the correct method and parameters were sent
         call_args = mock_post.call_args
-        request_data = json.loads(call_args[1]['json'])
+        request_data = json.loads(call_args[1]['data'])
         assert request_data["method"] == "tools/call"
         assert request_data["params"]["name"] == "test_tool"
         assert request_data["params"]["arguments"] == arguments
@@ -0,0 +1,213 @@
+"""
+Tests for configuration management.
+
+This module contains unit tests for loading, saving and editing server configurations.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from simple_mcp_client.config import server_config
+from simple_mcp_client.config import (
+    ClientConfig,
+    ServerConfig,
+    add_server_config,
+    add_server_configs,
+    get_server_config,
+    list_server_configs,
+    load_config,
+    remove_server_config,
+)
+
+
+class TestServerConfigs:
+    """Test cases for server configuration helpers."""
+
+    def test_load_config_missing_file(self, tmp_path):
+        """Test loading a configuration file that does not exist."""
+        config = load_config(tmp_path / "config.json")
+        assert config.servers == []
+        assert config.enable_security is True
+
+    def test_add_and_get_server_config(self, tmp_path):
+        """Test adding a server and reading it back."""
+        config_path = tmp_path / "config.json"
+        assert add_server_config("math", "http://localhost:8001", tags=["math"], config_path=config_path)
+
+        server = get_server_config("math", config_path)
+        assert server.url == "http://localhost:8001"
+        assert server.tags == ["math"]
+
+    def test_add_server_config_duplicate(self, tmp_path):
+        """Test adding a server whose name or URL already exists."""
+        config_path = tmp_path / "config.json"
+        add_server_config("math", "http://localhost:8001", config_path=config_path)
+
+        assert add_server_config("math", "http://localhost:8009", config_path=config_path) is False
+        assert add_server_config("other", "http://localhost:8001", config_path=config_path) is False
+        assert len(list_server_configs(config_path)) == 1
+
+    def test_add_server_configs_single_save(self, tmp_path):
+        """Test bulk addition writes the file once and skips existing servers."""
+        config_path = tmp_path / "config.json"
+        add_server_config("math", "http://localhost:8001", config_path=config_path)
+
+        with patch.object(server_config, 'save_config', wraps=server_config.save_config) as mock_save:
+            results = add_server_configs([
+                {"name": "math", "url": "http://localhost:8001"},
+                {"name": "files", "url": "http://localhost:8002", "priority": 2},
+                {"name": "files", "url": "http://localhost:8003"},
+            ], config_path)
+
+        assert results == [False, True, False]
+        mock_save.assert_called_once()
+        assert [s.name for s in list_server_configs(config_path)] == ["math", "files"]
+
+    def test_add_server_configs_all_existing(self, tmp_path):
+        """Test bulk addition does not rewrite the file when nothing is new."""
+        config_path = tmp_path / "config.json"
+        add_server_config("math", "http://localhost:8001", config_path=config_path)
+
+        with patch.object(server_config, 'save_config') as mock_save:
+            results = add_server_configs([{"name": "math", "url": "http://localhost:8001"}], config_path)
+
+        assert results == [False]
+        mock_save.assert_not_called()
+
+    def test_remove_server_config(self, tmp_path):
+        """Test removing a configured server."""
+        config_path = tmp_path / "config.json"
+        add_server_config("math", "http://localhost:8001", config_path=config_path)
+
+        assert remove_server_config("math", config_path) is True
+        assert remove_server_config("math", config_path) is False
+        assert list_server_configs(config_path) == []
+
+    def test_list_server_configs_cached(self, tmp_path):
+        """Test repeated listing reuses the parsed file until it changes."""
+        config_path = tmp_path / "config.json"
+        add_server_config("math", "http://localhost:8001", config_path=config_path)
+
+        with patch.object(server_config, '_read_config', wraps=server_config._read_config) as mock_read:
+            assert len(list_server_configs(config_path)) == 1
+            assert len(list_server_configs(config_path)) == 1
+            assert mock_read.call_count == 1
+
+            add_server_config("files", "http://localhost:8002", config_path=config_path)
+            assert [s.name for s in list_server_configs(config_path)] == ["math", "files"]
+
+    def test_load_config_returns_copy(self, tmp_path):
+        """Test changes to a loaded config do not leak into the cache."""
+        config_path = tmp_path / "config.json"
+        add_server_config("math", "http://localhost:8001", config_path=config_path)
+
+        load_config(config_path).servers.clear()
+        assert [s.name for s in load_config(config_path).servers] == ["math"]
+
+        config = load_config(config_path)
+        config.add_server(ServerConfig(name="files", url="http://localhost:8002"))
+        config.enable_security = False
+        fresh = load_config(config_path)
+        assert fresh.get_server("files") is None
+        assert fresh.enable_security is True
+        assert fresh.servers[0] is config.servers[0]
+
+    def test_enabled_servers(self, tmp_path):
+        """Test only enabled servers are listed, in configuration order."""
+        config_path = tmp_path / "config.json"
+        add_server_configs([
+            {"name": "math", "url": "http://localhost:8001"},
+            {"name": "files", "url": "http://localhost:8002", "enabled": False},
+            {"name": "search", "url": "http://localhost:8003"},
+        ], config_path)
+
+        config = load_config(config_path)
+        assert [s.name for s in config.enabled_servers] == ["math", "search"]
+        assert config.enabled_servers is config.enabled_servers
+        assert "enabled_servers" not in config.model_dump()
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test non-ASCII settings survive a save and reload."""
+        config_path = tmp_path / "config.json"
+        add_server_config("café", "http://localhost:8001", description="Données", config_path=config_path)
+
+        server = get_server_config("café", config_path)
+        assert server.description == "Données"
+
+    def test_load_config_invalid_file(self, tmp_path, capsys):
+        """Test an unparsable configuration file falls back to the defaults."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"servers": [{"name": "math"}]}')
+
+        assert load_config(config_path).servers == []
+        assert "Error loading config" in capsys.readouterr().out
+
+    def test_own_writes_skip_validation(self, tmp_path):
+        """Test files written by save_config are reloaded without validation."""
+        config_path = tmp_path / "config.json"
+        add_server_config("math", "http://localhost:8001", tags=["math"], config_path=config_path)
+
+        with patch.object(ClientConfig, 'model_validate_json') as mock_validate:
+            config = load_config(config_path)
+
+        mock_validate.assert_not_called()
+        assert config.get_server("math").tags == ["math"]
+        assert config.default_timeout == 30
+
+    def test_save_config_replaces_atomically(self, tmp_path, capsys):
+        """Test a failed save keeps the previous file and leaves no temporary file."""
+        config_path = tmp_path / "config.json"
+        add_server_config("math", "http://localhost:8001", config_path=config_path)
+
+        with patch.object(server_config.os, 'replace', side_effect=OSError("disk full")):
+            add_server_config("files", "http://localhost:8002", config_path=config_path)
+
+        assert "Error saving config" in capsys.readouterr().out
+        assert [s.name for s in list_server_configs(config_path)] == ["math"]
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+class TestClientConfig:
+    """Test cases for the ClientConfig server lookups."""
+
+    def test_server_lookups(self):
+        """Test servers can be found by name and URL and kept in sync on changes."""
+        config = ClientConfig(servers=[ServerConfig(name="math", url="http://localhost:8001")])
+        assert config.get_server("math").url == "http://localhost:8001"
+        assert config.has_server(url="http://localhost:8001") is True
+        assert [s.name for s in config.enabled_servers] == ["math"]
+
+        config.add_server(ServerConfig(name="files", url="http://localhost:8002"))
+        assert config.has_server(name="files") is True
+        assert [s.name for s in config.enabled_servers] == ["math", "files"]
+
+        assert config.remove_server("math").name == "math"
+        assert config.get_server("math") is None
+        assert config.has_server(url="http://localhost:8001") is False
+        assert [s.name for s in config.enabled_servers] == ["files"]
+        assert config.remove_server("math") is None
+
+    def test_server_configs_are_frozen(self):
+        """Test a server cannot be renamed behind the client config lookups."""
+        server = ServerConfig(name="math", url="http://localhost:8001")
+        config = ClientConfig(servers=[server])
+
+        with pytest.raises(ValidationError):
+            server.name = "files"
+
+        config.default_timeout = 5
+        assert config.default_timeout == 5
+        assert config.get_server("math") is server
+
+    def test_assigning_servers_resets_lookups(self):
+        """Test replacing the servers list keeps the lookups current."""
+        config = ClientConfig(servers=[ServerConfig(name="math", url="http://localhost:8001")])
+        assert [s.name for s in config.enabled_servers] == ["math"]
+        assert config.get_server("math") is not None
+
+        config.servers = [ServerConfig(name="files", url="http://localhost:8002")]
+        assert config.get_server("math") is None
+        assert config.get_server("files").url == "http://localhost:8002"
+        assert [s.name for s in config.enabled_servers] == ["files"]
@@ -0,0 +1,221 @@
+"""
+Tests for the MultiMCPClient class.
+
+This module contains unit tests for multi-server management and tool routing.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from simple_mcp_client.core.client import MCPResponse
+from simple_mcp_client.core.multi_client import MultiMCPClient, ToolNotFoundError
+
+
+def make_tools_response(*names):
+    """Build a tools/list response containing the given tool names."""
+    return MCPResponse(result={
+        "tools": [{"name": name, "description": f"{name} tool"} for name in names]
+    })
+
+
+class TestMultiMCPClient:
+    """Test cases for MultiMCPClient class."""
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_add_server(self, mock_connect, mock_list_tools):
+        """Test adding a server discovers its tools."""
+        mock_list_tools.return_value = make_tools_response("calculator")
+
+        with MultiMCPClient(enable_security=False) as client:
+            assert client.add_server("http://localhost:8001/") is True
+            assert "http://localhost:8001" in client.servers
+            assert client.find_tool("calculator").server_url == "http://localhost:8001"
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_add_server_duplicate(self, mock_connect, mock_list_tools):
+        """Test adding the same server twice is rejected."""
+        mock_list_tools.return_value = make_tools_response()
+
+        with MultiMCPClient(enable_security=False) as client:
+            assert client.add_server("http://localhost:8001") is True
+            assert client.add_server("http://localhost:8001") is False
+
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=False)
+    def test_add_server_connection_failure(self, mock_connect):
+        """Test adding an unreachable server."""
+        with MultiMCPClient(enable_security=False) as client:
+            assert client.add_server("http://localhost:8001") is False
+            assert client.servers == {}
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_add_servers_concurrently(self, mock_connect, mock_list_tools):
+        """Test that servers added from several threads are all registered."""
+        mock_list_tools.return_value = make_tools_response("tool")
+        urls = [f"http://localhost:{8000 + i}" for i in range(8)]
+
+        with MultiMCPClient(enable_security=False) as client:
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                results = list(executor.map(client.add_server, urls))
+
+            assert results == [True] * len(urls)
+            assert set(client.servers) == set(urls)
+            assert client.get_stats()["servers_added"] == len(urls)
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect')
+    def test_add_same_server_concurrently(self, mock_connect, mock_list_tools):
+        """Test a losing concurrent add leaves none of its tools in the index."""
+        mock_list_tools.side_effect = lambda: make_tools_response("calculator")
+        # Both adds pass the initial duplicate check before either registers
+        barrier = threading.Barrier(2)
+        mock_connect.side_effect = lambda: barrier.wait(timeout=5) is not None
+        url = "http://localhost:8001"
+
+        with MultiMCPClient(enable_security=False) as client:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(client.add_server, [url, url]))
+
+            assert sorted(results) == [False, True]
+            assert client.find_tool("calculator") is client.servers[url].tools[0]
+            assert client.get_stats()["tools_discovered"] == 1
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_add_servers(self, mock_connect, mock_list_tools):
+        """Test bulk adding servers returns results in input order."""
+        mock_list_tools.return_value = make_tools_response("tool")
+        urls = ["http://localhost:8001", "http://localhost:8002", "http://localhost:8001"]
+
+        with MultiMCPClient(enable_security=False) as client:
+            results = client.add_servers(urls)
+
+            assert sorted(results) == [False, True, True]
+            assert results[1] is True
+            assert set(client.servers) == {"http://localhost:8001", "http://localhost:8002"}
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_servers_share_session(self, mock_connect, mock_list_tools):
+        """Test every server client reuses the multi-client's HTTP session."""
+        mock_list_tools.return_value = make_tools_response()
+        session = requests.Session()
+        
+        with patch.object(session, 'close') as mock_close:
+            with MultiMCPClient(enable_security=False, http_session=session) as client:
+                client.add_servers(["http://localhost:8001", "http://localhost:8002"])
+                assert all(server.client.session is session for server in client.servers.values())
+            
+            # A caller-provided session is left open
+            mock_close.assert_not_called()
+    
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_refresh_tools(self, mock_connect, mock_list_tools):
+        """Test refreshing all servers rediscovers their tools."""
+        mock_list_tools.return_value = make_tools_response("calculator")
+
+        with MultiMCPClient(enable_security=False) as client:
+            client.add_servers(["http://localhost:8001", "http://localhost:8002"])
+            mock_list_tools.return_value = make_tools_response("reader")
+            client.refresh_tools()
+
+            assert client.find_tool("reader") is not None
+            assert client.find_tool("calculator") is None
+            assert all(
+                [tool.name for tool in server.tools] == ["reader"]
+                for server in client.servers.values()
+            )
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_remove_server(self, mock_connect, mock_list_tools):
+        """Test removing a server drops its tools."""
+        mock_list_tools.return_value = make_tools_response("calculator")
+
+        with MultiMCPClient(enable_security=False) as client:
+            client.add_server("http://localhost:8001")
+            assert client.remove_server("http://localhost:8001") is True
+            assert client.find_tool("calculator") is None
+            assert client.remove_server("http://localhost:8001") is False
+
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_remove_server_keeps_other_servers_tools(self, mock_connect, mock_list_tools):
+        """Test removing a server keeps a same-named tool registered by another."""
+        mock_list_tools.return_value = make_tools_response("calculator")
+        
+        with MultiMCPClient(enable_security=False) as client:
+            client.add_server("http://localhost:8001")
+            client.add_server("http://localhost:8002")
+            client.remove_server("http://localhost:8001")
+            assert client.find_tool("calculator").server_url == "http://localhost:8002"
+    
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_search_tools(self, mock_connect, mock_list_tools):
+        """Test searching tools by name and description."""
+        mock_list_tools.return_value = MCPResponse(result={"tools": [
+            {"name": "calculator", "description": "Basic arithmetic"},
+            {"name": "reader", "description": "Read a FILE from disk"},
+        ]})
+
+        with MultiMCPClient(enable_security=False) as client:
+            client.add_server("http://localhost:8001")
+            assert [t.name for t in client.search_tools("CALC")] == ["calculator"]
+            assert [t.name for t in client.search_tools("file")] == ["reader"]
+            assert client.search_tools("db") == []
+
+    def test_call_tool_not_found(self):
+        """Test calling an unknown tool."""
+        with MultiMCPClient(enable_security=False) as client:
+            with pytest.raises(ToolNotFoundError, match="not found"):
+                client.call_tool("missing", {})
+    
+    @patch('simple_mcp_client.core.client.MCPClient.call_tool', autospec=True)
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_call_tool_all(self, mock_connect, mock_list_tools, mock_call_tool):
+        """Test broadcasting a call to every server offering the tool."""
+        mock_list_tools.return_value = make_tools_response("calculator")
+        mock_call_tool.side_effect = lambda self, name, args: MCPResponse(result={"server": self.server_url})
+        urls = ["http://localhost:8001", "http://localhost:8002"]
+        
+        with MultiMCPClient(enable_security=False) as client:
+            client.add_servers(urls)
+            responses = client.call_tool("calculator", {}, mode="all")
+            
+            assert list(responses) == urls
+            assert all(responses[url].result == {"server": url} for url in urls)
+            assert client.get_stats()["requests_routed"] == 2
+    
+    @patch('simple_mcp_client.core.client.MCPClient.call_tool', autospec=True)
+    @patch('simple_mcp_client.core.client.MCPClient.list_tools')
+    @patch('simple_mcp_client.core.client.MCPClient.connect', return_value=True)
+    def test_call_tool_race(self, mock_connect, mock_list_tools, mock_call_tool):
+        """Test racing a call returns the first successful response."""
+        def call_tool(self, name, args):
+            if self.server_url.endswith("8001"):
+                raise ConnectionError("server down")
+            return MCPResponse(result={"server": self.server_url})
+        
+        mock_list_tools.return_value = make_tools_response("calculator")
+        mock_call_tool.side_effect = call_tool
+        
+        with MultiMCPClient(enable_security=False) as client:
+            client.add_servers(["http://localhost:8001", "http://localhost:8002"])
+            response = client.call_tool("calculator", {}, mode="race")
+            
+            assert response.result == {"server": "http://localhost:8002"}
+    
+    def test_call_tool_invalid_mode(self):
+        """Test an unknown call mode is rejected."""
+        with MultiMCPClient(enable_security=False) as client:
+            with pytest.raises(ValueError, match="Unknown call mode"):
+                client.call_tool("missing", {}, mode="fastest")
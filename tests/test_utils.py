@@ -5,10 +5,17 @@ This module contains unit tests for helper functions.
 """
 
 import json
+from unittest.mock import patch
+
 import pytest
 
+from simple_mcp_client.utils import json_fast
+from simple_mcp_client.utils.ttl_cache import TTLCache, content_key
 from simple_mcp_client.utils.helpers import (
+    canonical_json,
+    create_session,
     format_request,
+    format_request_bytes,
     parse_response,
     validate_url,
     safe_json_loads,
@@ -49,6 +56,13 @@ class TestFormatRequest:
             "id": "123"
         }
         assert result == expected
+    
+    def test_format_request_bytes(self):
+        """Test the encoded request matches format_request, with and without orjson."""
+        params = {"name": "café"}
+        assert json.loads(format_request_bytes("tools/call", params)) == format_request("tools/call", params)
+        with patch.object(json_fast, 'orjson', None):
+            assert json.loads(format_request_bytes("tools/list")) == format_request("tools/list")
 
 
 class TestParseResponse:
@@ -81,6 +95,11 @@ class TestParseResponse:
         with pytest.raises(ValueError, match="Invalid JSON-RPC response format"):
             parse_response(response_data)
     
+    def test_parse_response_not_an_object(self):
+        """Test parsing a response that is not a JSON object."""
+        with pytest.raises(ValueError, match="Invalid JSON-RPC response format"):
+            parse_response(["jsonrpc", "2.0"])
+    
     def test_parse_response_with_error(self):
         """Test parsing a response with error."""
         response_data = {
@@ -118,6 +137,15 @@ class TestValidateUrl:
         """Test validating an empty URL."""
         assert validate_url("") is False
     
+    def test_validate_url_missing_host(self):
+        """Test validating a URL without a host."""
+        assert validate_url("http://") is False
+        assert validate_url("https:///path") is False
+    
+    def test_validate_url_whitespace(self):
+        """Test validating a URL containing whitespace."""
+        assert validate_url("http://local host:8000") is False
+    
     def test_validate_url_none(self):
         """Test validating a None URL."""
         assert validate_url(None) is False
@@ -171,4 +199,127 @@ class TestSafeJsonLoads:
         assert result is not None
         assert "tools" in result
         assert len(result["tools"]) == 1
-        assert result["tools"][0]["name"] == "tool1" 
\ No newline at end of file
+        assert result["tools"][0]["name"] == "tool1" 
+    
+    def test_safe_json_loads_bytes(self):
+        """Test parsing UTF-8 encoded bytes, with and without orjson."""
+        assert safe_json_loads('{"name": "café"}'.encode()) == {"name": "café"}
+        with patch.object(json_fast, 'orjson', None):
+            assert safe_json_loads(b'{"a": 1}') == {"a": 1}
+            assert safe_json_loads(b'{"a": 1') is None
+
+
+class TestCanonicalJson:
+    """Test cases for canonical_json function."""
+    
+    def test_canonical_json_key_order(self):
+        """Test equal dictionaries serialise identically and compactly."""
+        assert canonical_json({"b": 1, "a": [1, 2]}) == canonical_json({"a": [1, 2], "b": 1})
+        assert canonical_json({"b": 1, "a": "é"}) == '{"a":"é","b":1}'
+    
+    def test_canonical_json_fallbacks(self):
+        """Test unsupported values and unsortable keys still produce text."""
+        assert canonical_json({"when": object}) == '{"when":"<class \'object\'>"}'
+        assert canonical_json({1: "a", "b": 2}) == "{1: 'a', 'b': 2}"
+
+
+class TestCreateSession:
+    """Test cases for create_session function."""
+    
+    def test_create_session_pooled_adapter(self):
+        """Test the session mounts a pooled adapter with retries."""
+        session = create_session({"Accept": "application/json"}, pool_maxsize=8)
+        adapter = session.get_adapter("https://api.example.com")
+        
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.total == 3
+        assert session.headers["Accept"] == "application/json"
+    
+    def test_create_session_without_retries(self):
+        """Test retries can be disabled."""
+        session = create_session(max_retries=0)
+        adapter = session.get_adapter("http://localhost:8000")
+        assert adapter.max_retries.total == 0
+
+
+class TestJsonFastDumps:
+    """Test cases for the json_fast.dumps function."""
+
+    def test_dumps_compact(self):
+        """Test compact serialisation returns UTF-8 bytes."""
+        result = json_fast.dumps({"name": "café", "values": [1, 2]})
+        assert isinstance(result, bytes)
+        assert json.loads(result) == {"name": "café", "values": [1, 2]}
+        assert "café".encode() in result
+
+    def test_dumps_indent(self):
+        """Test pretty-printed output matches the standard library layout."""
+        data = {"tools": [{"name": "calculator"}]}
+        assert json_fast.dumps(data, indent=True).decode() == json.dumps(data, indent=2)
+
+    def test_dumps_default(self):
+        """Test unsupported objects are converted with the default hook."""
+        result = json_fast.dumps({"value": {1, 2}}, default=sorted)
+        assert json.loads(result) == {"value": [1, 2]}
+
+    def test_dumps_stdlib_fallback(self):
+        """Test serialisation without orjson installed."""
+        with patch.object(json_fast, 'orjson', None):
+            assert json_fast.dumps({"name": "café"}) == '{"name": "café"}'.encode()
+            assert json_fast.dumps({"a": 1}, indent=True).decode() == json.dumps({"a": 1}, indent=2)
+
+
+class TestJsonFastLoads:
+    """Test cases for the json_fast.loads function."""
+
+    def test_loads_str_and_bytes(self):
+        """Test parsing both text and bytes."""
+        assert json_fast.loads('{"query": "MCP"}') == {"query": "MCP"}
+        assert json_fast.loads(b'[1, 2]') == [1, 2]
+
+    def test_loads_invalid(self):
+        """Test invalid JSON raises the shared decode error type."""
+        with pytest.raises(json_fast.JSONDecodeError):
+            json_fast.loads("{not json")
+
+    def test_loads_stdlib_fallback(self):
+        """Test parsing without orjson installed."""
+        with patch.object(json_fast, 'orjson', None):
+            assert json_fast.loads('{"a": 1}') == {"a": 1}
+            with pytest.raises(json_fast.JSONDecodeError):
+                json_fast.loads("{not json")
+
+
+class TestTTLCache:
+    """Test cases for the TTLCache class."""
+
+    def test_get_and_expiry(self):
+        """Test values are returned until their TTL passes."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.put("key", "value", now=0)
+        assert cache.get("key", now=30) == "value"
+        assert cache.get("key", now=60) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.put("a", 1, now=0)
+        cache.put("b", 2, now=0)
+        cache.get("a", now=1)
+        cache.put("c", 3, now=1)
+        assert cache.get("a", now=2) == 1
+        assert cache.get("b", now=2) is None
+
+    def test_disabled(self):
+        """Test a cache without a TTL stores nothing."""
+        cache = TTLCache(maxsize=4, ttl=None)
+        cache.put("key", "value", now=0)
+        assert cache.enabled is False
+        assert cache.get("key", now=0) is None
+
+    def test_content_key(self):
+        """Test content keys are compact and deterministic."""
+        assert content_key("text") == content_key("text")
+        assert content_key("text") != content_key("other")
+        assert len(content_key("text")) == 16